@@ -47,6 +47,7 @@ from paraping.keymap import KeyContext, resolve_action
 from paraping.network_asn import asn_worker, should_retry_asn
 from paraping.pinger import rdns_worker, scheduler_driven_worker_ping
 from paraping.ui_render import (
+    activity_indicator_tick,
     build_display_entries,
     build_display_lines,
     build_display_names,
@@ -55,15 +56,20 @@ from paraping.ui_render import (
     compute_panel_sizes,
     compute_pulse_panel_sizes,
     cycle_panel_position,
+    disable_terminal_size_cache,
+    enable_terminal_size_cache,
     flash_screen,
     format_timestamp,
     get_terminal_size,
+    mark_display_names_dirty,
+    next_activity_indicator_tick_time,
     prepare_terminal_for_exit,
     render_display,
     render_fullscreen_rtt_graph,
     render_help_view,
     render_host_selection_view,
     reset_render_cache,
+    resolve_boxed_dimensions,
     ring_bell,
     should_flash_on_fail,
     should_show_asn,
@@ -112,6 +118,8 @@ def _compute_initial_timeline_width(
     panel_height = max(1, normalized_size.lines - status_box_height)
     main_width, main_height, _, _, _ = compute_panel_sizes(normalized_size.columns, panel_height, panel_position)
     main_width, main_height, _, _, _ = compute_pulse_panel_sizes(main_width, main_height, pulse_position)
+    # The main panel is drawn inside a box, so size buffers to the boxed row width.
+    main_width, main_height, _ = resolve_boxed_dimensions(main_width, main_height, True)
     # Always use header_lines=2 for consistent initial sizing
     _, _, timeline_width, _ = compute_main_layout(host_labels, main_width, main_height, header_lines=2)
     try:
@@ -135,6 +143,8 @@ def _compute_runtime_timeline_width(state: Dict[str, Any], term_size: Any) -> in
     panel_height = max(1, normalized_size.lines - status_box_height)
     main_width, main_height, _, _, _ = compute_panel_sizes(normalized_size.columns, panel_height, state["panel_position"])
     main_width, main_height, _, _, _ = compute_pulse_panel_sizes(main_width, main_height, state.get("pulse_position", "none"))
+    # Match the boxed row width the renderer uses so its resize_buffers pass is a no-op.
+    main_width, main_height, _ = resolve_boxed_dimensions(main_width, main_height, True)
     mode_label = state["modes"][state["mode_index"]]
     include_asn = should_show_asn(state["host_infos"], mode_label, state["show_asn"], normalized_size.columns, asn_width=8)
     display_names = build_display_names(state["host_infos"], mode_label, include_asn, asn_width=8)
@@ -669,6 +679,7 @@ def _apply_manual_reload(
 
     state["host_info_map"] = _rebuild_host_info_map(state["host_infos"])
     _sync_group_by_modes(state)
+    mark_display_names_dirty()
     state["cached_page_step"] = None
     state["updated"] = True
     state["force_render"] = True
@@ -1198,6 +1209,7 @@ def _update_render_state(state: Dict[str, Any]) -> None:
         for info in state["host_info_map"].get(host, []):
             info["rdns"] = rdns_value
             info["rdns_pending"] = False
+        mark_display_names_dirty()
         if not state["paused"]:
             state["updated"] = True
 
@@ -1209,6 +1221,7 @@ def _update_render_state(state: Dict[str, Any]) -> None:
         for info in state["host_info_map"].get(host, []):
             info["asn"] = asn_value
             info["asn_pending"] = False
+        mark_display_names_dirty()
         ip_address = state["host_info_map"][host][0]["ip"] if state["host_info_map"].get(host) else host
         state["asn_cache"][ip_address] = {"value": asn_value, "fetched_at": time.time()}
         if not state["paused"]:
@@ -1224,6 +1237,7 @@ def _update_render_state(state: Dict[str, Any]) -> None:
         if should_retry_asn(ip_address, state["asn_cache"], now, state["asn_failure_ttl"]):
             for info in infos:
                 info["asn_pending"] = True
+            mark_display_names_dirty()
             state["asn_request_queue"].put((host, ip_address))
 
     while True:
@@ -1266,17 +1280,33 @@ def _update_render_state(state: Dict[str, Any]) -> None:
 def _render_frame(args: argparse.Namespace, state: Dict[str, Any]) -> None:
     """Render a frame when needed based on update and refresh timing state."""
     now = time.time()
-    refresh_interval = 0.05 if state["kitt_mode_enabled"] else state["refresh_interval"]
-    should_render = state["force_render"] or (
-        not state["paused"] and (state["updated"] or (now - state["last_render"]) >= refresh_interval)
-    )
+    if state["kitt_mode_enabled"]:
+        periodic_due = (now - state["last_render"]) >= 0.05
+    else:
+        # Without new data only the clock and the activity indicator move, so
+        # periodic refreshes wait for the next indicator tick instead of waking
+        # mid-tick and redrawing an identical frame.
+        periodic_due = (now - state["last_render"]) >= state["refresh_interval"] and now >= state["next_frame_clock_time"]
+    should_render = state["force_render"] or (not state["paused"] and (state["updated"] or periodic_due))
     if not should_render:
         return
-    display_timestamp = format_timestamp(datetime.now(timezone.utc), state["display_tz"])
+    now_utc = datetime.now(timezone.utc)
+    display_timestamp = format_timestamp(now_utc, state["display_tz"])
     snapshot_timestamp = state.get("render_snapshot_timestamp")
     if snapshot_timestamp is not None:
         snapshot_dt = datetime.fromtimestamp(snapshot_timestamp, timezone.utc)
         display_timestamp = format_timestamp(snapshot_dt, state["display_tz"])
+    # Periodic refreshes only change the clock and the activity indicator (Pulse mode animates every frame).
+    frame_clock = (display_timestamp, activity_indicator_tick(now_utc))
+    if (
+        not state["force_render"]
+        and not state["updated"]
+        and not state["kitt_mode_enabled"]
+        and frame_clock == state.get("last_frame_clock")
+    ):
+        state["last_render"] = now
+        state["next_frame_clock_time"] = next_activity_indicator_tick_time(now)
+        return
     max_offset, _visible_hosts, _total_hosts = compute_host_scroll_bounds(
         state["host_infos"],
         state["render_buffers"],
@@ -1389,6 +1419,8 @@ def _render_frame(args: argparse.Namespace, state: Dict[str, Any]) -> None:
         pulse_position=state["pulse_position"],
     )
     state["last_render"] = now
+    state["last_frame_clock"] = frame_clock
+    state["next_frame_clock_time"] = next_activity_indicator_tick_time(now)
     state["updated"] = False
     state["force_render"] = False
 
@@ -1486,6 +1518,8 @@ def run(args: argparse.Namespace) -> None:
         "updated": True,
         "interval_seconds": args.interval,
         "last_render": 0.0,
+        "last_frame_clock": None,
+        "next_frame_clock_time": 0.0,
         "refresh_interval": 0.10,
         "last_observed_term_size": initial_term_size,
         "next_resize_check_time": now_monotonic + 1.0,
@@ -1545,9 +1579,11 @@ def run(args: argparse.Namespace) -> None:
             for entry in infos:
                 entry["asn_pending"] = True
             state["asn_request_queue"].put((host, info["ip"]))
+    mark_display_names_dirty()
     for info in state["host_infos"]:
         _start_host_worker(info, args, state, scheduler, ping_lock, sequence_tracker)
 
+    previous_winch_handler = enable_terminal_size_cache()
     try:
         if stdin_fd is not None:
             tty.setcbreak(stdin_fd)
@@ -1572,6 +1608,7 @@ def run(args: argparse.Namespace) -> None:
             thread.join(timeout=1.0)
         if stdin_fd is not None and original_term is not None:
             termios.tcsetattr(stdin_fd, termios.TCSADRAIN, original_term)
+        disable_terminal_size_cache(previous_winch_handler)
 
     prepare_terminal_for_exit()
     print("\n" + "=" * 60)
@@ -20,7 +20,7 @@ standard deviation, streaks, and aggregated ping data.
 
 import math
 import re
-from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 TAG_INDEX_GROUP_RE = re.compile(r"^tag(\d+)$")
 HIER_GROUP_SITE_TAG1 = "site>tag1"
@@ -47,6 +47,103 @@ def compute_fail_streak(timeline: Sequence[str], fail_symbol: str) -> int:
     return streak
 
 
+def resolve_streak(
+    timeline: Sequence[str],
+    host_stats: Dict[str, Any],
+    symbols: Dict[str, str],
+) -> Tuple[Optional[str], int]:
+    """
+    Resolve the current streak type and length for one host.
+
+    The v2 engine maintains ``streak_type``/``streak_length`` incrementally as
+    results arrive; those are used directly when present. Stats built without
+    them fall back to scanning the timeline from the end.
+
+    Args:
+        timeline: Deque of status symbols
+        host_stats: Per-host statistics dictionary
+        symbols: Dictionary mapping status to symbol
+
+    Returns:
+        Tuple of (streak_type, streak_length) where streak_type is
+        "success", "fail", or None
+    """
+    if "streak_type" in host_stats:
+        streak_type = host_stats["streak_type"]
+        if streak_type is None:
+            return None, 0
+        # Render buffers may be narrower than the engine timeline they mirror.
+        return streak_type, min(host_stats["streak_length"], len(timeline))
+
+    if not timeline:
+        return None, 0
+    last = timeline[-1]
+    if last == symbols["success"] or last == symbols["slow"]:
+        success_symbols = {symbols["success"], symbols["slow"]}
+        streak_length = 0
+        for symbol in reversed(timeline):
+            if symbol in success_symbols:
+                streak_length += 1
+            else:
+                break
+        return "success", streak_length
+    if last == symbols["fail"]:
+        return "fail", compute_fail_streak(timeline, symbols["fail"])
+    return None, 0
+
+
+def compute_jitter(rtt_history: Iterable[Optional[float]]) -> Tuple[Optional[float], int]:
+    """
+    Compute mean absolute difference between consecutive RTT samples.
+
+    Missing samples (None) are skipped, so pairs are formed from adjacent
+    received replies. Runs in a single pass without building temporary lists.
+
+    Args:
+        rtt_history: Iterable of RTT values in seconds (None for no reply)
+
+    Returns:
+        Tuple of (jitter in milliseconds or None, number of sample pairs)
+    """
+    previous = None
+    total = 0.0
+    pairs = 0
+    for value in rtt_history:
+        if value is None:
+            continue
+        if previous is not None:
+            total += abs(value - previous)
+            pairs += 1
+        previous = value
+    if pairs == 0:
+        return None, 0
+    return total / pairs * 1000, pairs
+
+
+def resolve_jitter(rtt_history: Sequence[Optional[float]], host_stats: Dict[str, Any]) -> Tuple[Optional[float], int]:
+    """
+    Resolve jitter for a host, preferring the engine-maintained running sums.
+
+    The v2 engine keeps ``jitter_sum``/``jitter_pairs`` up to date as replies
+    arrive and leave the timeline window. They are only used when they cover
+    the same window as ``rtt_history``; otherwise the history is scanned.
+
+    Args:
+        rtt_history: Sequence of RTT values in seconds (None for no reply)
+        host_stats: Per-host statistics dictionary
+
+    Returns:
+        Tuple of (jitter in milliseconds or None, number of sample pairs)
+    """
+    if "jitter_pairs" in host_stats and host_stats.get("jitter_window") == len(rtt_history):
+        pairs = host_stats["jitter_pairs"]
+        if pairs <= 0:
+            return None, 0
+        # Running sums can drift a hair below zero after many subtractions.
+        return max(0.0, host_stats["jitter_sum"]) / pairs * 1000, pairs
+    return compute_jitter(rtt_history)
+
+
 def build_streak_label(entry: Dict[str, Any]) -> str:
     """
     Build a display label for a streak.
@@ -81,6 +178,40 @@ def build_packet_stats_label(entry: Dict[str, Any]) -> str:
     return f"{sent}/{received}/{lost} loss {entry['loss_rate']:.1f}%"
 
 
+def _format_ms(value: Optional[float]) -> str:
+    """Format a millisecond value with one decimal, or 'n/a' when missing."""
+    return "n/a" if value is None else format(value, ".1f") + " ms"
+
+
+def _build_rtt_suffix(entry: Dict[str, Any]) -> str:
+    return (
+        f": avg rtt {_format_ms(entry.get('avg_rtt_ms'))}"
+        f" jitter {_format_ms(entry.get('jitter_ms'))}"
+        f" stddev {_format_ms(entry.get('stddev_ms'))}"
+    )
+
+
+def _build_ttl_suffix(entry: Dict[str, Any]) -> str:
+    latest_ttl = entry.get("latest_ttl")
+    return f": ttl {latest_ttl}" if latest_ttl is not None else ": ttl n/a"
+
+
+def _build_streak_suffix(entry: Dict[str, Any]) -> str:
+    return f": streak {build_streak_label(entry)}"
+
+
+def _build_rates_suffix(entry: Dict[str, Any]) -> str:
+    return f": {build_packet_stats_label(entry)}"
+
+
+SUMMARY_SUFFIX_BUILDERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "rtt": _build_rtt_suffix,
+    "ttl": _build_ttl_suffix,
+    "streak": _build_streak_suffix,
+    "rates": _build_rates_suffix,
+}
+
+
 def build_summary_suffix(entry: Dict[str, Any], summary_mode: str) -> str:
     """
     Build the suffix for a summary line based on the summary mode.
@@ -92,18 +223,8 @@ def build_summary_suffix(entry: Dict[str, Any], summary_mode: str) -> str:
     Returns:
         Formatted suffix string
     """
-    if summary_mode == "rtt":
-        avg_rtt = f"{entry['avg_rtt_ms']:.1f} ms" if entry.get("avg_rtt_ms") is not None else "n/a"
-        jitter = f"{entry['jitter_ms']:.1f} ms" if entry.get("jitter_ms") is not None else "n/a"
-        stddev = f"{entry['stddev_ms']:.1f} ms" if entry.get("stddev_ms") is not None else "n/a"
-        return f": avg rtt {avg_rtt} jitter {jitter} stddev {stddev}"
-    if summary_mode == "ttl":
-        latest_ttl = entry.get("latest_ttl")
-        return f": ttl {latest_ttl}" if latest_ttl is not None else ": ttl n/a"
-    if summary_mode == "streak":
-        return f": streak {build_streak_label(entry)}"
-    # Default mode is 'rates' - show Snt/Rcv/Los and loss percentage
-    return f": {build_packet_stats_label(entry)}"
+    # Unknown modes fall back to 'rates' (Snt/Rcv/Los and loss percentage)
+    return SUMMARY_SUFFIX_BUILDERS.get(summary_mode, _build_rates_suffix)(entry)
 
 
 def build_summary_all_suffix(entry: Dict[str, Any]) -> str:
@@ -116,21 +237,16 @@ def build_summary_all_suffix(entry: Dict[str, Any]) -> str:
     Returns:
         Formatted suffix string with all statistics
     """
-    avg_rtt = f"{entry['avg_rtt_ms']:.1f} ms" if entry.get("avg_rtt_ms") is not None else "n/a"
-    jitter = f"{entry['jitter_ms']:.1f} ms" if entry.get("jitter_ms") is not None else "n/a"
-    stddev = f"{entry['stddev_ms']:.1f} ms" if entry.get("stddev_ms") is not None else "n/a"
     latest_ttl = entry.get("latest_ttl")
-    ttl_value = f"{latest_ttl}" if latest_ttl is not None else "n/a"
-    streak_label = build_streak_label(entry)
-    parts = [
-        build_packet_stats_label(entry),
-        f"avg rtt {avg_rtt}",
-        f"jitter {jitter}",
-        f"stddev {stddev}",
-        f"ttl {ttl_value}",
-        f"streak {streak_label}",
-    ]
-    return f": {' | '.join(parts)}"
+    ttl_value = "n/a" if latest_ttl is None else str(latest_ttl)
+    return (
+        f": {build_packet_stats_label(entry)}"
+        f" | avg rtt {_format_ms(entry.get('avg_rtt_ms'))}"
+        f" | jitter {_format_ms(entry.get('jitter_ms'))}"
+        f" | stddev {_format_ms(entry.get('stddev_ms'))}"
+        f" | ttl {ttl_value}"
+        f" | streak {build_streak_label(entry)}"
+    )
 
 
 def compute_summary_data(
@@ -156,7 +272,6 @@ def compute_summary_data(
         List of summary data dictionaries, one per host
     """
     summary = []
-    success_symbols = {symbols["success"], symbols["slow"]}
     info_by_id = {info["id"]: info for info in host_infos}
     host_ids = ordered_host_ids if ordered_host_ids is not None else [info["id"] for info in host_infos]
     for host_id in host_ids:
@@ -169,25 +284,7 @@ def compute_summary_data(
         fail = stats[host_id]["fail"]
         success_rate = (success / total * 100) if total > 0 else 0.0
         loss_rate = (fail / total * 100) if total > 0 else 0.0
-        timeline = list(buffers[host_id]["timeline"])
-        streak_type = None
-        streak_length = 0
-        if timeline:
-            last = timeline[-1]
-            if last in success_symbols:
-                streak_type = "success"
-                for symbol in reversed(timeline):
-                    if symbol in success_symbols:
-                        streak_length += 1
-                    else:
-                        break
-            elif last == symbols["fail"]:
-                streak_type = "fail"
-                for symbol in reversed(timeline):
-                    if symbol == symbols["fail"]:
-                        streak_length += 1
-                    else:
-                        break
+        streak_type, streak_length = resolve_streak(buffers[host_id]["timeline"], stats[host_id], symbols)
         avg_rtt_ms = None
         if stats[host_id]["rtt_count"] > 0:
             avg_rtt_ms = stats[host_id]["rtt_sum"] / stats[host_id]["rtt_count"] * 1000
@@ -197,11 +294,7 @@ def compute_summary_data(
             mean_square = stats[host_id].get("rtt_sum_sq", 0.0) / stats[host_id]["rtt_count"]
             variance = max(0.0, mean_square - mean_rtt * mean_rtt)
             stddev_ms = math.sqrt(variance) * 1000
-        rtt_values = [value for value in buffers[host_id]["rtt_history"] if value is not None]
-        jitter_ms = None
-        if len(rtt_values) >= 2:
-            diffs = [abs(current - previous) for previous, current in zip(rtt_values, rtt_values[1:])]
-            jitter_ms = sum(diffs) / len(diffs) * 1000
+        jitter_ms, _jitter_pairs = resolve_jitter(buffers[host_id]["rtt_history"], stats[host_id])
         latest_ttl = latest_ttl_value(buffers[host_id]["ttl_history"])
         summary.append(
             {
@@ -393,14 +486,11 @@ def compute_group_summary_data(
             labels = [labels_map["site_label"], labels_map["composite_label"]]
         else:
             labels = resolve_group_labels(info, group_by)
-        timeline = list(buffers[host_id]["timeline"])
+        timeline = buffers[host_id]["timeline"]
         latest_symbol = timeline[-1] if timeline else None
-        fail_streak = compute_fail_streak(timeline, symbols["fail"])
-        rtt_values = [value for value in buffers[host_id]["rtt_history"] if value is not None]
-        jitter_ms = None
-        if len(rtt_values) >= 2:
-            diffs = [abs(current - previous) for previous, current in zip(rtt_values, rtt_values[1:])]
-            jitter_ms = sum(diffs) / len(diffs) * 1000
+        streak_type, streak_length = resolve_streak(timeline, host_stats, symbols)
+        fail_streak = streak_length if streak_type == "fail" else 0
+        jitter_ms, jitter_pairs = resolve_jitter(buffers[host_id]["rtt_history"], host_stats)
 
         for label in labels:
             group = groups.setdefault(
@@ -434,10 +524,9 @@ def compute_group_summary_data(
             group["_rtt_sum"] += host_stats["rtt_sum"]
             group["_rtt_sum_sq"] += host_stats.get("rtt_sum_sq", 0.0)
             group["_rtt_count"] += host_stats["rtt_count"]
-            if jitter_ms is not None and len(rtt_values) > 1:
-                weight = len(rtt_values) - 1
-                group["_jitter_weighted_sum"] += jitter_ms * weight
-                group["_jitter_weight"] += weight
+            if jitter_ms is not None:
+                group["_jitter_weighted_sum"] += jitter_ms * jitter_pairs
+                group["_jitter_weight"] += jitter_pairs
             latest_ttl = latest_ttl_value(buffers[host_id]["ttl_history"])
             if latest_ttl is not None:
                 group["latest_ttl"] = latest_ttl
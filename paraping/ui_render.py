@@ -22,19 +22,22 @@ view rendering, graph utilities, formatting functions, and terminal utilities.
 import math
 import os
 import re
+import signal
 import sys
 import textwrap
 import time
 import unicodedata
 from collections import deque
 from datetime import datetime, timezone, tzinfo
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional, Sequence, Tuple, Union
 
 from paraping.keymap import build_help_items
 from paraping.stats import (
     build_summary_all_suffix,
     build_summary_suffix,
-    compute_fail_streak,
     compute_group_summary_data,
     compute_summary_data,
     is_hierarchical_group_by,
@@ -44,20 +47,40 @@ from paraping.stats import (
     resolve_group_labels,
     resolve_primary_group_label,
     resolve_site_tag1_labels,
+    resolve_streak,
 )
 
 # ANSI and display constants (imported from main)
 ANSI_RESET = "\x1b[0m"
 ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+ANSI_TOKEN_RE = re.compile(r"(\x1b\[[0-9;]*m)")
 STATUS_COLORS = {
     "success": "\x1b[37m",  # White
     "slow": "\x1b[33m",  # Yellow
     "fail": "\x1b[31m",  # Red
     "pending": "\x1b[90m",  # Dark gray (bright black)
 }
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
 ACTIVITY_INDICATOR_WIDTH = 10
 ACTIVITY_INDICATOR_HEIGHT = 4
 ACTIVITY_INDICATOR_SPEED_HZ = 8
+_SORT_LABELS = {
+    "failures": "Failure Count",
+    "streak": "Failure Streak",
+    "latency": "Latest Latency",
+    "host": "Host Name",
+}
+_FILTER_LABELS = {
+    "failures": "Failures Only",
+    "latency": "High Latency Only",
+    "all": "All Items",
+}
+_SUMMARY_LABELS = {
+    "rates": "Rates",
+    "rtt": "Avg RTT",
+    "ttl": "TTL",
+    "streak": "Streak",
+}
 STATUS_METRICS_SEPARATOR = " | "
 STATUS_METRICS_TEMPLATE = STATUS_METRICS_SEPARATOR.join(
     ["Hosts: {hosts}", "Success: {success}", "Errors: {errors}", "Rate: {rate}"]
@@ -70,6 +93,26 @@ KITT_SCANNER_STATE: Dict[str, float] = {
     "scanner_phase": 0.0,
     "last_error_ratio": 0.0,
 }
+# Formatted display names per host id, keyed by the inputs that shape them
+DISPLAY_NAME_CACHE: Dict[int, Tuple[Tuple[Any, ...], str]] = {}
+# Last build_display_names result, reused until host labels are marked dirty
+DISPLAY_NAMES_STATE: Dict[str, Any] = {
+    "version": 0,
+    "key": None,
+    "host_infos": None,
+    "names": None,
+}
+# Timezone label for the last (display timezone, UTC minute) formatted
+TIMEZONE_LABEL_CACHE: Dict[str, Any] = {
+    "key": None,
+    "label": "",
+}
+# Terminal size cache, only active while a SIGWINCH handler is installed
+TERMINAL_SIZE_STATE: Dict[str, Any] = {
+    "enabled": False,
+    "dirty": True,
+    "size": None,
+}
 
 
 # ============================================================================
@@ -79,12 +122,16 @@ KITT_SCANNER_STATE: Dict[str, float] = {
 
 def strip_ansi(text: str) -> str:
     """Remove ANSI escape sequences from text."""
+    if "\x1b" not in text:
+        return text
     return ANSI_ESCAPE_RE.sub("", text)
 
 
 def visible_len(text: str) -> int:
     """Get the visible length of text (excluding ANSI codes)."""
-    return len(strip_ansi(text))
+    if "\x1b" not in text:
+        return len(text)
+    return len(ANSI_ESCAPE_RE.sub("", text))
 
 
 def visible_cell_width(text: str) -> int:
@@ -109,22 +156,32 @@ def truncate_visible(text: str, width: int) -> Tuple[str, int]:
     """
     Truncate text to a visible width, preserving ANSI codes.
 
+    The text is split once into alternating visible/escape chunks, so the
+    scan is linear in the input.
+
     Returns:
         Tuple of (truncated_text, visible_count)
     """
+    if width <= 0:
+        return "", 0
+    if "\x1b" not in text:
+        truncated = text[:width]
+        return truncated, len(truncated)
     result = []
     visible_count = 0
-    index = 0
-    while index < len(text) and visible_count < width:
-        if text[index] == "\x1b":
-            match = ANSI_ESCAPE_RE.match(text, index)
-            if match:
-                result.append(match.group(0))
-                index = match.end()
-                continue
-        result.append(text[index])
-        index += 1
-        visible_count += 1
+    for index, part in enumerate(ANSI_TOKEN_RE.split(text)):
+        if index % 2:
+            result.append(part)
+            continue
+        if not part:
+            continue
+        remaining = width - visible_count
+        if len(part) >= remaining:
+            result.append(part[:remaining])
+            visible_count = width
+            break
+        result.append(part)
+        visible_count += len(part)
     truncated = "".join(result)
     if "\x1b[" in truncated and not truncated.endswith(ANSI_RESET):
         truncated += ANSI_RESET
@@ -133,6 +190,8 @@ def truncate_visible(text: str, width: int) -> Tuple[str, int]:
 
 def pad_visible(text: str, width: int) -> str:
     """Pad text to a visible width, preserving ANSI codes."""
+    if width > 0 and "\x1b" not in text:
+        return text[:width].ljust(width)
     truncated, visible_count = truncate_visible(text, width)
     if visible_count < width:
         truncated += " " * (width - visible_count)
@@ -147,6 +206,14 @@ def rjust_visible(text: str, width: int) -> str:
     return f"{' ' * padding}{text}"
 
 
+def _compose_row(prefix: str, body: str, body_width: int, width: int) -> str:
+    """Join a row prefix and a right-justified body of known visible width in one step."""
+    padding = width - body_width
+    if padding <= 0:
+        return f"{prefix}{body}"
+    return f"{prefix}{' ' * padding}{body}"
+
+
 def colorize_text(text: str, status: Optional[str], use_color: bool) -> str:
     """Apply color to text based on status."""
     if not use_color or not status:
@@ -165,6 +232,34 @@ def status_from_symbol(symbol: str, symbols: Dict[str, str]) -> Optional[str]:
     return None
 
 
+def _invert_symbols(symbols: Dict[str, str]) -> Dict[str, str]:
+    """Build a symbol -> status map with the same precedence as status_from_symbol."""
+    return _invert_symbol_items(tuple(symbols.items()))
+
+
+# The symbol set is fixed for a session, so the derived lookup tables are built
+# once and shared by every row instead of being rebuilt per host. Callers must
+# treat the returned dicts as read-only.
+@lru_cache(maxsize=4)
+def _invert_symbol_items(symbol_items: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    """Build the symbol -> status map for a frozen symbol set."""
+    inverse: Dict[str, str] = {}
+    for status, status_symbol in symbol_items:
+        inverse.setdefault(status_symbol, status)
+    return inverse
+
+
+def _build_symbol_color_table(symbols: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """Map each status symbol to its ANSI color code (None when uncolored)."""
+    return _symbol_color_items(tuple(symbols.items()))
+
+
+@lru_cache(maxsize=4)
+def _symbol_color_items(symbol_items: Tuple[Tuple[str, str], ...]) -> Dict[str, Optional[str]]:
+    """Build the symbol -> color map for a frozen symbol set."""
+    return {symbol: STATUS_COLORS.get(status) for symbol, status in _invert_symbol_items(symbol_items).items()}
+
+
 def latest_status_from_timeline(timeline: Sequence[str], symbols: Dict[str, str]) -> Optional[str]:
     """Get the latest status from a timeline."""
     if not timeline:
@@ -174,8 +269,9 @@ def latest_status_from_timeline(timeline: Sequence[str], symbols: Dict[str, str]
 
 def latest_non_pending_status_from_timeline(timeline: Sequence[str], symbols: Dict[str, str]) -> Optional[str]:
     """Get the latest non-pending status from a timeline."""
+    inverse = _invert_symbols(symbols)
     for symbol in reversed(timeline):
-        status = status_from_symbol(symbol, symbols)
+        status = inverse.get(symbol)
         if status and status != "pending":
             return status
     return None
@@ -199,7 +295,16 @@ def host_label_status(status: Optional[str]) -> Optional[str]:
 
 def build_colored_timeline(timeline: Sequence[str], symbols: Dict[str, str], use_color: bool) -> str:
     """Build a colored timeline string from symbols."""
-    return "".join(colorize_text(symbol, status_from_symbol(symbol, symbols), use_color) for symbol in timeline)
+    if not use_color:
+        return "".join(timeline)
+    # Emit one color span per run of same-colored symbols instead of wrapping
+    # every glyph, which keeps redraw output small for steady timelines.
+    colors = _build_symbol_color_table(symbols)
+    spans = []
+    for color, run in groupby(timeline, key=colors.get):
+        text = "".join(run)
+        spans.append(f"{color}{text}{ANSI_RESET}" if color else text)
+    return "".join(spans)
 
 
 def resolve_host_label_status(timeline: Sequence[str], symbols: Dict[str, str], is_removed: bool = False) -> Optional[str]:
@@ -221,11 +326,13 @@ def build_colored_sparkline(
     """Build a colored sparkline from characters and status symbols."""
     if not use_color:
         return sparkline
-    colored = []
-    for char, symbol in zip(sparkline, status_symbols):
-        status = status_from_symbol(symbol, symbols)
-        colored.append(colorize_text(char, status, use_color))
-    return "".join(colored)
+    # Color whole runs of same-status bars at once rather than wrapping each bar.
+    colors = _build_symbol_color_table(symbols)
+    spans = []
+    for color, run in groupby(zip(sparkline, status_symbols), key=lambda pair: colors.get(pair[1])):
+        text = "".join([char for char, _ in run])
+        spans.append(f"{color}{text}{ANSI_RESET}" if color else text)
+    return "".join(spans)
 
 
 def build_activity_indicator(
@@ -237,19 +344,34 @@ def build_activity_indicator(
     """Build an animated activity indicator sparkline."""
     if width <= 0:
         return ""
-    tick = int(now_utc.timestamp() * speed_hz)
+    tick = activity_indicator_tick(now_utc, speed_hz)
     span = max(1, width - 1)
     cycle = span * 2
     position = tick % cycle
     if position > span:
         position = cycle - position
-    spark_chars = "▁▂▃▄▅▆▇█"
-    peak = min(max_height, len(spark_chars) - 1)
-    levels = []
-    for index in range(width):
-        height = max(0, peak - abs(index - position))
-        levels.append(spark_chars[height] if height > 0 else spark_chars[0])
-    return "".join(levels)
+    peak = min(max_height, len(SPARK_CHARS) - 1)
+    return _activity_indicator_frame(position, width, peak)
+
+
+def activity_indicator_tick(now_utc: datetime, speed_hz: int = ACTIVITY_INDICATOR_SPEED_HZ) -> int:
+    """Return the animation step the activity indicator shows at ``now_utc``."""
+    return int(now_utc.timestamp() * speed_hz)
+
+
+def next_activity_indicator_tick_time(timestamp: float, speed_hz: int = ACTIVITY_INDICATOR_SPEED_HZ) -> float:
+    """Return the epoch time at which the activity indicator next advances.
+
+    With an integer speed every whole second is also a tick boundary, so this
+    is the earliest time the header clock or the indicator can change.
+    """
+    return (int(timestamp * speed_hz) + 1) / speed_hz
+
+
+@lru_cache(maxsize=256)
+def _activity_indicator_frame(position: int, width: int, peak: int) -> str:
+    """Render one indicator frame; frames repeat every cycle, so they are cached."""
+    return "".join(SPARK_CHARS[max(0, peak - abs(index - position))] for index in range(width))
 
 
 def compute_activity_indicator_width(
@@ -615,7 +737,7 @@ def render_pulse_panel(
 
     normalized_style = style if style in ("scanner", "gradient") else "scanner"
     style_label = "Scanner" if normalized_style == "scanner" else "Gradient"
-    lines = [f"Pulse [{style_label}]".ljust(width)[:width], "-" * width]
+    lines = [f"Pulse [{style_label}]".ljust(width)[:width], _dash_line(width)]
     body_height = max(1, height - 2)
     active_rows, start_row = _resolve_kitt_profile(body_height)
     scanner_center: Optional[float] = None
@@ -641,7 +763,7 @@ def render_pulse_panel(
             )
         else:
             if row < start_row or row >= start_row + active_rows:
-                bar = " " * width
+                bar = _blank_line(width)
             else:
                 error_ratio = _compute_error_ratio(error_hosts, total_hosts)
                 strong_color, soft_color = _resolve_kitt_palette(error_ratio)
@@ -694,6 +816,9 @@ def get_terminal_size(fallback: Tuple[int, int] = (80, 24)) -> os.terminal_size:
     first (like shutil does). This ensures the size updates when the
     terminal is resized.
 
+    While enable_terminal_size_cache() is in effect, the last size read
+    from a terminal is reused until SIGWINCH reports a resize.
+
     Args:
         fallback: Tuple of (columns, lines) to use if terminal size
                   cannot be determined
@@ -701,29 +826,79 @@ def get_terminal_size(fallback: Tuple[int, int] = (80, 24)) -> os.terminal_size:
     Returns:
         os.terminal_size with columns and lines attributes
     """
+    cache = TERMINAL_SIZE_STATE
+    cached_size: Optional[os.terminal_size] = cache["size"]
+    if cache["enabled"] and not cache["dirty"] and cached_size is not None:
+        return cached_size
+    size, from_tty = _query_terminal_size(fallback)
+    if cache["enabled"] and from_tty:
+        cache["size"] = size
+        cache["dirty"] = False
+    return size
+
+
+def _mark_terminal_resized(_signum: int, _frame: Any) -> None:
+    """SIGWINCH handler: invalidate the cached terminal size."""
+    TERMINAL_SIZE_STATE["dirty"] = True
+
+
+def enable_terminal_size_cache() -> Any:
+    """
+    Cache terminal size lookups and refresh them only on SIGWINCH.
+
+    Returns:
+        The previously installed SIGWINCH handler, or None when the platform
+        has no SIGWINCH or the handler cannot be installed (non-main thread).
+        In that case sizes keep being queried on every call.
+    """
+    if not hasattr(signal, "SIGWINCH"):
+        return None
+    try:
+        previous_handler = signal.signal(signal.SIGWINCH, _mark_terminal_resized)
+    except (ValueError, OSError):
+        return None
+    TERMINAL_SIZE_STATE["enabled"] = True
+    TERMINAL_SIZE_STATE["dirty"] = True
+    return previous_handler
+
+
+def disable_terminal_size_cache(previous_handler: Any = None) -> None:
+    """Stop caching terminal size and restore the previous SIGWINCH handler."""
+    if TERMINAL_SIZE_STATE["enabled"] and previous_handler is not None:
+        try:
+            signal.signal(signal.SIGWINCH, previous_handler)
+        except (ValueError, OSError):
+            pass
+    TERMINAL_SIZE_STATE["enabled"] = False
+    TERMINAL_SIZE_STATE["dirty"] = True
+    TERMINAL_SIZE_STATE["size"] = None
+
+
+def _query_terminal_size(fallback: Tuple[int, int]) -> Tuple[os.terminal_size, bool]:
+    """Query the terminal size, returning (size, from_tty)."""
     try:
         # Try stdout first
         if sys.stdout.isatty():
-            return os.get_terminal_size(sys.stdout.fileno())
+            return os.get_terminal_size(sys.stdout.fileno()), True
     except (AttributeError, ValueError, OSError):
         pass
 
     try:
         # Try stderr if stdout fails
         if sys.stderr.isatty():
-            return os.get_terminal_size(sys.stderr.fileno())
+            return os.get_terminal_size(sys.stderr.fileno()), True
     except (AttributeError, ValueError, OSError):
         pass
 
     try:
         # Try stdin as last resort
         if sys.stdin.isatty():
-            return os.get_terminal_size(sys.stdin.fileno())
+            return os.get_terminal_size(sys.stdin.fileno()), True
     except (AttributeError, ValueError, OSError):
         pass
 
     # Fall back to default size
-    return os.terminal_size(fallback)
+    return os.terminal_size(fallback), False
 
 
 def compute_main_layout(
@@ -731,6 +906,12 @@ def compute_main_layout(
 ) -> Tuple[int, int, int, int]:
     """Compute the main layout dimensions for the display."""
     max_host_len = max((len(host) for host in host_labels), default=4)
+    return _main_layout_dimensions(max_host_len, width, height, header_lines)
+
+
+@lru_cache(maxsize=64)
+def _main_layout_dimensions(max_host_len: int, width: int, height: int, header_lines: int) -> Tuple[int, int, int, int]:
+    """Derive main layout dimensions from the widest label (cached per geometry)."""
     label_width = min(max_host_len, max(10, width // 3))
     timeline_width = max(1, width - label_width - 3)
     visible_hosts = max(1, height - header_lines)
@@ -738,6 +919,7 @@ def compute_main_layout(
     return width, label_width, timeline_width, visible_hosts
 
 
+@lru_cache(maxsize=64)
 def compute_panel_sizes(
     term_width: int,
     term_height: int,
@@ -816,12 +998,16 @@ def compute_summary_height_bounds(
     prefer_all: bool,
     width: int,
     boxed: bool,
+    all_suffixes: Optional[Sequence[str]] = None,
+    all_fits: Optional[bool] = None,
 ) -> Tuple[int, int]:
     """Return (content_height, minimal_height) for the summary panel."""
     render_width = _summary_render_width(width, boxed)
     if render_width <= 0:
         return 0, 0
-    allow_all = prefer_all and can_render_full_summary(summary_data, render_width)
+    if all_fits is None:
+        all_fits = can_render_full_summary(summary_data, render_width, all_suffixes) if prefer_all else False
+    allow_all = prefer_all and all_fits
     show_legend = ((summary_mode == "rates" and not allow_all) or allow_all) and bool(summary_data)
     content_height = 2 + (1 if show_legend else 0) + len(summary_data)
     minimal_height = 2 + (1 if show_legend else 0) + (1 if summary_data else 0)
@@ -847,13 +1033,18 @@ def should_show_asn(
     asn_width: int = 8,
 ) -> bool:
     """Determine if ASN should be shown based on available space."""
-    if not show_asn:
-        return False
-    base_label_width = max((len(resolve_display_name(info, mode)) for info in host_infos), default=0)
-    labels = [format_display_name(info, mode, True, asn_width, base_label_width) for info in host_infos]
-    if not labels:
+    if not show_asn or not host_infos:
         return False
-    label_width = max(len(label) for label in labels)
+    # With ASN enabled every label is padded to the widest base name followed by
+    # a fixed-width ASN column, so the widest label can be derived in one pass
+    # without formatting each host's full display name.
+    resolver = _DISPLAY_NAME_RESOLVERS.get(mode, _resolve_ip_name)
+    base_label_width = 0
+    any_removed = False
+    for info in host_infos:
+        base_label_width = max(base_label_width, len(resolver(info)))
+        any_removed = any_removed or bool(info.get("removed"))
+    label_width = base_label_width + 1 + asn_width + (len(" [REMOVED]") if any_removed else 0)
     timeline_width = term_width - label_width - 3
     return timeline_width >= min_timeline_width
 
@@ -914,36 +1105,38 @@ def compute_host_scroll_bounds(
         group_by=group_by,
         group_sort_enabled=group_sort_enabled,
     )
-    active_host_infos = [info for info in host_infos if info.get("active", True)]
-    active_host_ids = {info["id"] for info in active_host_infos}
-    ordered_host_ids = [host_id for host_id, _label in display_entries if host_id in active_host_ids]
-    summary_data = compute_summary_data(
-        active_host_infos,
-        display_names,
-        buffers,
-        stats,
-        symbols,
-        ordered_host_ids=ordered_host_ids,
-    )
-    group_summary_data: List[Dict[str, Any]] = []
-    if group_by != "none":
-        group_order: List[str] = []
-        host_group_labels = {info["id"]: resolve_primary_group_label(info, group_by) for info in active_host_infos}
-        for host_id in ordered_host_ids:
-            label = host_group_labels.get(host_id)
-            if label and label not in group_order:
-                group_order.append(label)
-        group_summary_data = compute_group_summary_data(
+    # Only a top/bottom summary panel takes height from the host list, so the
+    # summary rows are built just for that layout.
+    if panel_position in ("top", "bottom"):
+        active_host_infos = [info for info in host_infos if info.get("active", True)]
+        active_host_ids = {info["id"] for info in active_host_infos}
+        ordered_host_ids = [host_id for host_id, _label in display_entries if host_id in active_host_ids]
+        summary_data = compute_summary_data(
             active_host_infos,
             display_names,
             buffers,
             stats,
             symbols,
-            group_by=group_by,
-            ordered_group_labels=group_order,
+            ordered_host_ids=ordered_host_ids,
         )
-    summary_source = group_summary_data if summary_scope == "group" and group_by != "none" else summary_data
-    if panel_position in ("top", "bottom"):
+        group_summary_data: List[Dict[str, Any]] = []
+        if group_by != "none":
+            group_order: List[str] = []
+            host_group_labels = {info["id"]: resolve_primary_group_label(info, group_by) for info in active_host_infos}
+            for host_id in ordered_host_ids:
+                label = host_group_labels.get(host_id)
+                if label and label not in group_order:
+                    group_order.append(label)
+            group_summary_data = compute_group_summary_data(
+                active_host_infos,
+                display_names,
+                buffers,
+                stats,
+                symbols,
+                group_by=group_by,
+                ordered_group_labels=group_order,
+            )
+        summary_source = group_summary_data if summary_scope == "group" and group_by != "none" else summary_data
         _, _, summary_width, summary_height, _ = compute_panel_sizes(
             term_width,
             panel_height,
@@ -951,13 +1144,16 @@ def compute_host_scroll_bounds(
             min_main_height=min_main_height,
         )
         summary_render_width = _summary_render_width(summary_width, use_panel_boxes)
-        summary_all = can_render_full_summary(summary_source, summary_render_width)
+        summary_suffixes = precompute_summary_suffixes(summary_source)
+        summary_all = can_render_full_summary(summary_source, summary_render_width, summary_suffixes)
         content_height, minimal_height = compute_summary_height_bounds(
             summary_source,
             summary_mode,
             summary_all,
             summary_width,
             boxed=use_panel_boxes,
+            all_suffixes=summary_suffixes,
+            all_fits=summary_all,
         )
         max_summary_height = max(0, panel_height - min_main_height - gap_size)
         summary_height = min(summary_height, content_height, max_summary_height)
@@ -977,11 +1173,23 @@ def compute_host_scroll_bounds(
 # ============================================================================
 
 
+@lru_cache(maxsize=8)
+def _dash_line(width: int) -> str:
+    """Return a separator of width dashes, shared across frames of the same size."""
+    return "-" * width
+
+
+@lru_cache(maxsize=8)
+def _blank_line(width: int) -> str:
+    """Return a row of width spaces, shared across frames of the same size."""
+    return " " * width
+
+
 def pad_lines(lines: Sequence[str], width: int, height: int) -> List[str]:
     """Pad lines to fill the specified width and height."""
     padded = [pad_visible(line, width) for line in lines[:height]]
-    while len(padded) < height:
-        padded.append("".ljust(width))
+    if len(padded) < height:
+        padded.extend([_blank_line(width)] * (height - len(padded)))
     return padded
 
 
@@ -1017,28 +1225,31 @@ def box_lines(lines: Sequence[str], width: int, height: int) -> List[str]:
     inner_width, inner_height, can_box = resolve_boxed_dimensions(width, height, True)
     if not can_box:
         return pad_lines(lines, width, height)
-    inner_lines = pad_lines(lines, inner_width, inner_height)
-    border = "-" * inner_width
-    boxed = [f"+{border}+"]
-    boxed.extend(f"|{line}|" for line in inner_lines)
-    boxed.append(f"+{border}+")
+    # Pad and frame in a single pass instead of building an intermediate padded list.
+    border = f"+{_dash_line(inner_width)}+"
+    boxed = [border]
+    boxed.extend([f"|{pad_visible(line, inner_width)}|" for line in lines[:inner_height]])
+    if len(boxed) <= inner_height:
+        boxed.extend([f"|{_blank_line(inner_width)}|"] * (inner_height + 1 - len(boxed)))
+    boxed.append(border)
     return boxed
 
 
+_RESIZABLE_BUFFER_KEYS = ("timeline", "rtt_history", "time_history", "ttl_history")
+
+
 def resize_buffers(buffers: Dict[int, Dict[str, Any]], timeline_width: int, symbols: Dict[str, str]) -> None:
     """Resize all buffers to match the timeline width."""
-    for _, host_buffers in buffers.items():
-        if host_buffers["timeline"].maxlen != timeline_width:
-            host_buffers["timeline"] = deque(host_buffers["timeline"], maxlen=timeline_width)
-        if host_buffers["rtt_history"].maxlen != timeline_width:
-            host_buffers["rtt_history"] = deque(host_buffers["rtt_history"], maxlen=timeline_width)
-        if host_buffers["time_history"].maxlen != timeline_width:
-            host_buffers["time_history"] = deque(host_buffers["time_history"], maxlen=timeline_width)
-        if host_buffers["ttl_history"].maxlen != timeline_width:
-            host_buffers["ttl_history"] = deque(host_buffers["ttl_history"], maxlen=timeline_width)
+    for host_buffers in buffers.values():
+        for key in _RESIZABLE_BUFFER_KEYS:
+            buffer = host_buffers[key]
+            if buffer.maxlen != timeline_width:
+                host_buffers[key] = deque(buffer, maxlen=timeline_width)
+        categories = host_buffers["categories"]
         for status in symbols:
-            if host_buffers["categories"][status].maxlen != timeline_width:
-                host_buffers["categories"][status] = deque(host_buffers["categories"][status], maxlen=timeline_width)
+            category = categories[status]
+            if category.maxlen != timeline_width:
+                categories[status] = deque(category, maxlen=timeline_width)
 
 
 # ============================================================================
@@ -1048,34 +1259,27 @@ def resize_buffers(buffers: Dict[int, Dict[str, Any]], timeline_width: int, symb
 
 def build_sparkline(rtt_values: Sequence[Optional[float]], status_symbols: Sequence[str], fail_symbol: str) -> str:
     """Build a sparkline from RTT values."""
-    spark_chars = "▁▂▃▄▅▆▇█"
     if rtt_values:
         numeric_values = [value for value in rtt_values if value is not None]
     else:
         numeric_values = []
 
-    if numeric_values:
-        min_val = min(numeric_values)
-        max_val = max(numeric_values)
-        span = max_val - min_val
-        if span == 0:
-            span = 1
-        indices = []
-        for value in rtt_values:
-            if value is None:
-                indices.append(0)
-            else:
-                idx = round((value - min_val) / span * (len(spark_chars) - 1))
-                indices.append(max(0, min(len(spark_chars) - 1, idx)))
-    else:
-        indices = []
-        for symbol in status_symbols:
-            if symbol == fail_symbol:
-                indices.append(0)
-            else:
-                indices.append(len(spark_chars) - 1)
+    low_char = SPARK_CHARS[0]
+    if not numeric_values:
+        high_char = SPARK_CHARS[-1]
+        return "".join([low_char if symbol == fail_symbol else high_char for symbol in status_symbols])
 
-    return "".join(spark_chars[idx] for idx in indices)
+    min_val = min(numeric_values)
+    max_val = max(numeric_values)
+    span = max_val - min_val
+    if span == 0:
+        span = 1
+    # Every numeric value lies within [min_val, max_val], so the rounded index
+    # is already within the character range and needs no clamping.
+    top_index = len(SPARK_CHARS) - 1
+    return "".join(
+        [low_char if value is None else SPARK_CHARS[round((value - min_val) / span * top_index)] for value in rtt_values]
+    )
 
 
 def build_ascii_graph(values: Sequence[Optional[float]], width: int, height: int, style: str = "line") -> List[str]:
@@ -1090,7 +1294,7 @@ def build_ascii_graph(values: Sequence[Optional[float]], width: int, height: int
 
     numeric_values = [value for value in trimmed_values if value is not None]
     if not numeric_values:
-        return [" " * width for _ in range(height)]
+        return [_blank_line(width)] * height
 
     min_val = min(numeric_values)
     max_val = max(numeric_values)
@@ -1098,20 +1302,25 @@ def build_ascii_graph(values: Sequence[Optional[float]], width: int, height: int
     if span == 0:
         span = 1.0
 
-    grid = [[" " for _ in range(width)] for _ in range(height)]
-    for x, value in enumerate(trimmed_values):
+    # Build each column as a string (one per distinct row offset) and transpose
+    # with zip, so no per-cell Python writes into a height x width grid remain.
+    last_row = height - 1
+    mark = "#" if style == "bar" else "*"
+    missing_column = " " * last_row + "x"
+    column_cache: Dict[int, str] = {}
+    columns = []
+    for value in trimmed_values:
         if value is None:
-            grid[height - 1][x] = "x"
+            columns.append(missing_column)
             continue
-        scaled = int(round((value - min_val) / span * (height - 1)))
-        y = height - 1 - scaled
-        if style == "bar":
-            for y_fill in range(y, height):
-                grid[y_fill][x] = "#"
-        else:
-            grid[y][x] = "*"
+        y = last_row - int(round((value - min_val) / span * last_row))
+        column = column_cache.get(y)
+        if column is None:
+            tail = mark * (height - y) if style == "bar" else mark + " " * (last_row - y)
+            column = column_cache[y] = " " * y + tail
+        columns.append(column)
 
-    return ["".join(row) for row in grid]
+    return ["".join(row) for row in zip(*columns)]
 
 
 def resample_values(values: Sequence[Optional[float]], target_width: int) -> List[Optional[float]]:
@@ -1127,8 +1336,14 @@ def resample_values(values: Sequence[Optional[float]], target_width: int) -> Lis
     if len(values) == target_width:
         return list(values)
 
-    last_index = len(values) - 1
-    return [values[round(i * last_index / (target_width - 1))] for i in range(target_width)]
+    return list(_resample_getter(len(values), target_width)(values))
+
+
+@lru_cache(maxsize=64)
+def _resample_getter(length: int, target_width: int) -> Callable[[Sequence[Any]], Tuple[Any, ...]]:
+    """Build (once per geometry) an itemgetter picking evenly spaced source indices."""
+    last_index = length - 1
+    return itemgetter(*[round(i * last_index / (target_width - 1)) for i in range(target_width)])
 
 
 # ============================================================================
@@ -1136,19 +1351,35 @@ def resample_values(values: Sequence[Optional[float]], target_width: int) -> Lis
 # ============================================================================
 
 
+def _resolve_ip_name(host_info: Dict[str, Any]) -> str:
+    """Return the IP address label."""
+    return str(host_info["ip"])
+
+
+def _resolve_rdns_name(host_info: Dict[str, Any]) -> str:
+    """Return the reverse-DNS label, falling back to the IP address."""
+    if host_info.get("rdns_pending"):
+        return "resolving..."
+    rdns_value = host_info.get("rdns")
+    return str(rdns_value) if rdns_value is not None else str(host_info["ip"])
+
+
+def _resolve_alias_name(host_info: Dict[str, Any]) -> str:
+    """Return the alias label, falling back to the host name or IP address."""
+    alias_value = host_info.get("alias") or host_info.get("host")
+    return str(alias_value) if alias_value is not None else str(host_info["ip"])
+
+
+_DISPLAY_NAME_RESOLVERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "ip": _resolve_ip_name,
+    "rdns": _resolve_rdns_name,
+    "alias": _resolve_alias_name,
+}
+
+
 def resolve_display_name(host_info: Dict[str, Any], mode: str) -> str:
     """Resolve the display name for a host based on mode."""
-    if mode == "ip":
-        return str(host_info["ip"])
-    if mode == "rdns":
-        if host_info.get("rdns_pending"):
-            return "resolving..."
-        rdns_value = host_info.get("rdns")
-        return str(rdns_value) if rdns_value is not None else str(host_info["ip"])
-    if mode == "alias":
-        alias_value = host_info.get("alias") or host_info.get("host")
-        return str(alias_value) if alias_value is not None else str(host_info["ip"])
-    return str(host_info["ip"])
+    return _DISPLAY_NAME_RESOLVERS.get(mode, _resolve_ip_name)(host_info)
 
 
 def format_asn_label(host_info: Dict[str, Any], asn_width: int) -> str:
@@ -1157,8 +1388,10 @@ def format_asn_label(host_info: Dict[str, Any], asn_width: int) -> str:
         label = "resolving..."
     else:
         asn_value = host_info.get("asn")
-        label = str(asn_value) if asn_value is not None else ""
-    return f"{label[:asn_width]:<{asn_width}}"
+        if asn_value is None:
+            return " " * asn_width
+        label = str(asn_value)
+    return label[:asn_width].ljust(asn_width)
 
 
 def format_display_name(
@@ -1173,20 +1406,93 @@ def format_display_name(
     if not include_asn:
         formatted = base_label
     else:
-        padded_label = f"{base_label:<{base_label_width}}" if base_label_width else base_label
-        asn_label = format_asn_label(host_info, asn_width)
-        formatted = f"{padded_label} {asn_label}"
+        formatted = base_label.ljust(base_label_width) + " " + format_asn_label(host_info, asn_width)
     if host_info.get("removed"):
         return f"{formatted} [REMOVED]"
     return formatted
 
 
 def build_display_names(host_infos: Sequence[Dict[str, Any]], mode: str, include_asn: bool, asn_width: int) -> Dict[int, str]:
-    """Build display names for all hosts."""
+    """Build display names for all hosts.
+
+    Formatted names are reused across frames while every input that shapes
+    them (base label, padding width, ASN fields, removed flag) is unchanged.
+    When the same host list object is passed again with the same options and
+    no mark_display_names_dirty() call in between, the previous names are
+    returned without touching any host.
+
+    Contract: code that changes alias, host, IP, rDNS, ASN, or removal fields
+    of host info dicts in place must call mark_display_names_dirty(), or the
+    old names keep being served. Replacing or resizing the host list is
+    detected without it. Each call returns a new dict, so callers may modify
+    the result freely.
+    """
+    state = DISPLAY_NAMES_STATE
+    names_key = (state["version"], mode, include_asn, asn_width, len(host_infos))
+    last_names: Optional[Dict[int, str]] = state["names"]
+    if last_names is not None and state["host_infos"] is host_infos and state["key"] == names_key:
+        return dict(last_names)
+    resolver = _DISPLAY_NAME_RESOLVERS.get(mode, _resolve_ip_name)
+    base_labels = [(info, resolver(info)) for info in host_infos]
     base_label_width = 0
     if include_asn:
-        base_label_width = max((len(resolve_display_name(info, mode)) for info in host_infos), default=0)
-    return {info["id"]: format_display_name(info, mode, include_asn, asn_width, base_label_width) for info in host_infos}
+        base_label_width = max((len(base_label) for _, base_label in base_labels), default=0)
+    cache = DISPLAY_NAME_CACHE
+    fresh_cache: Dict[int, Tuple[Tuple[Any, ...], str]] = {}
+    names: Dict[int, str] = {}
+    for info, base_label in base_labels:
+        host_id = info["id"]
+        key = (
+            base_label,
+            include_asn,
+            base_label_width,
+            asn_width,
+            info.get("asn_pending"),
+            info.get("asn"),
+            bool(info.get("removed")),
+        )
+        cached = cache.get(host_id)
+        if cached is not None and cached[0] == key:
+            name = cached[1]
+        else:
+            name = format_display_name(info, mode, include_asn, asn_width, base_label_width)
+        fresh_cache[host_id] = (key, name)
+        names[host_id] = name
+    # Replace wholesale so hosts that disappeared do not linger in the cache.
+    cache.clear()
+    cache.update(fresh_cache)
+    state["key"] = names_key
+    state["host_infos"] = host_infos
+    state["names"] = names
+    return dict(names)
+
+
+def mark_display_names_dirty() -> None:
+    """Invalidate reused display names after host label fields change in place.
+
+    Call this whenever alias, rDNS, ASN, or removal fields of existing host
+    info dicts are updated so the next build_display_names call rebuilds.
+    """
+    DISPLAY_NAMES_STATE["version"] += 1
+
+
+# Display entry tuple: (host_id, label, fail_count, fail_streak, latency, total).
+# Latency is the latest RTT in seconds, or -1.0 when there is none.
+DisplayEntry = Tuple[int, str, int, int, float, int]
+ENTRY_HOST_ID: Final = 0
+ENTRY_LABEL: Final = 1
+ENTRY_FAIL_COUNT: Final = 2
+ENTRY_FAIL_STREAK: Final = 3
+ENTRY_LATENCY: Final = 4
+ENTRY_TOTAL: Final = 5
+ENTRY_SORT_KEYS: Dict[str, Tuple[Callable[[DisplayEntry], Any], bool]] = {
+    # Config order follows host_id, which matches input file order.
+    "config": (itemgetter(ENTRY_HOST_ID), False),
+    "failures": (itemgetter(ENTRY_FAIL_COUNT, ENTRY_LABEL), True),
+    "streak": (itemgetter(ENTRY_FAIL_STREAK, ENTRY_LABEL), True),
+    "latency": (itemgetter(ENTRY_LATENCY, ENTRY_LABEL), True),
+    "host": (itemgetter(ENTRY_LABEL), False),
+}
 
 
 def build_display_entries(  # noqa: C901
@@ -1203,200 +1509,164 @@ def build_display_entries(  # noqa: C901
 ) -> List[Tuple[int, str]]:
     """Build and sort display entries based on current filter and sort modes."""
     info_by_id = {info["id"]: info for info in host_infos}
-    entries = []
+    entries: List[DisplayEntry] = []
+    # Fail streaks only influence ordering, so skip resolving them otherwise.
+    needs_streak = sort_mode == "streak"
+    filter_failures = filter_mode == "failures"
+    filter_latency = filter_mode == "latency"
     for info in host_infos:
         host_id = info["id"]
-        timeline = buffers[host_id]["timeline"]
-        latest_rtt = latest_rtt_value(buffers[host_id]["rtt_history"])
-        fail_streak = compute_fail_streak(timeline, symbols["fail"])
-        fail_count = stats[host_id]["fail"]
         stat_entry = stats[host_id]
+        fail_count = stat_entry["fail"]
+        # Removed hosts stay visible regardless of the active filter.
+        is_removed = bool(info.get("removed", False))
+        if filter_failures and not is_removed and fail_count <= 0:
+            continue
+        host_buffers = buffers[host_id]
+        latest_rtt = latest_rtt_value(host_buffers["rtt_history"])
+        if filter_latency and not is_removed and (latest_rtt is None or latest_rtt < slow_threshold):
+            continue
+
+        fail_streak = 0
+        if needs_streak:
+            # Engine-maintained streak fields avoid rescanning the timeline per frame.
+            streak_type, streak_length = resolve_streak(host_buffers["timeline"], stat_entry, symbols)
+            fail_streak = streak_length if streak_type == "fail" else 0
         total_count = stat_entry.get("total")
         if total_count is None:
-            total_count = stat_entry.get("success", 0) + stat_entry.get("slow", 0) + stat_entry.get("fail", 0)
-
-        include = True
-        is_removed = bool(info.get("removed", False))
-        if is_removed:
-            include = True
-        elif filter_mode == "failures":
-            include = fail_count > 0
-        elif filter_mode == "latency":
-            include = latest_rtt is not None and latest_rtt >= slow_threshold
-
-        if include:
-            entries.append(
-                {
-                    "host_id": host_id,
-                    "label": display_names.get(host_id, info["alias"]),
-                    "fail_count": fail_count,
-                    "fail_streak": fail_streak,
-                    "latest_rtt": latest_rtt,
-                    "total": total_count,
-                }
+            total_count = stat_entry.get("success", 0) + stat_entry.get("slow", 0) + fail_count
+        entries.append(
+            (
+                host_id,
+                display_names.get(host_id, info["alias"]),
+                fail_count,
+                fail_streak,
+                latest_rtt or -1.0,
+                total_count,
             )
+        )
 
     if group_sort_enabled and group_by == "site>tag1":
-        site_tag_groups: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        site_tag_groups: Dict[str, Dict[str, List[DisplayEntry]]] = {}
         for item in entries:
-            host_info = info_by_id[item["host_id"]]
+            host_info = info_by_id[item[ENTRY_HOST_ID]]
             site_label = resolve_primary_group_label(host_info, group_by)
             tag_group_labels = resolve_group_labels(host_info, group_by)
             tag_group_label = tag_group_labels[0] if tag_group_labels else "site:unknown>tag1:unknown"
             site_tag_groups.setdefault(site_label, {}).setdefault(tag_group_label, []).append(item)
 
-        def _ratio(group_entries: Sequence[Dict[str, Any]]) -> float:
-            total = int(sum(entry["total"] for entry in group_entries))
-            failures = int(sum(entry["fail_count"] for entry in group_entries))
-            return failures / max(1, total)
-
-        def _max_latency(group_entries: Sequence[Dict[str, Any]]) -> float:
-            return float(max((entry["latest_rtt"] or -1.0) for entry in group_entries))
-
-        def _max_streak(group_entries: Sequence[Dict[str, Any]]) -> int:
-            return int(max(entry["fail_streak"] for entry in group_entries))
-
         site_order = list(site_tag_groups.keys())
-        if sort_mode in ("config", "host"):
-            site_order.sort(key=natural_sort_key)
-        elif sort_mode == "failures":
-            site_order.sort(
-                key=lambda site_label: (
-                    _ratio([entry for by_tag in site_tag_groups[site_label].values() for entry in by_tag]),
-                    site_label,
-                ),
-                reverse=True,
-            )
-        elif sort_mode == "latency":
-            site_order.sort(
-                key=lambda site_label: (
-                    _max_latency([entry for by_tag in site_tag_groups[site_label].values() for entry in by_tag]),
-                    site_label,
-                ),
-                reverse=True,
-            )
-        elif sort_mode == "streak":
-            site_order.sort(
-                key=lambda site_label: (
-                    _max_streak([entry for by_tag in site_tag_groups[site_label].values() for entry in by_tag]),
-                    site_label,
-                ),
-                reverse=True,
-            )
+        site_entries = {
+            site_label: [entry for by_tag in tags_for_site.values() for entry in by_tag]
+            for site_label, tags_for_site in site_tag_groups.items()
+        }
+        _sort_group_labels(site_order, site_entries, sort_mode)
 
-        site_ordered_entries: List[Dict[str, Any]] = []
+        site_ordered_entries: List[DisplayEntry] = []
         for site_label in site_order:
             tags_for_site = site_tag_groups[site_label]
             tag_order = list(tags_for_site.keys())
-            if sort_mode in ("config", "host"):
-                tag_order.sort(key=natural_sort_key)
-            elif sort_mode == "failures":
-                tag_order.sort(key=lambda label: (_ratio(tags_for_site[label]), label), reverse=True)
-            elif sort_mode == "latency":
-                tag_order.sort(key=lambda label: (_max_latency(tags_for_site[label]), label), reverse=True)
-            elif sort_mode == "streak":
-                tag_order.sort(key=lambda label: (_max_streak(tags_for_site[label]), label), reverse=True)
-
+            _sort_group_labels(tag_order, tags_for_site, sort_mode)
             for tag_label in tag_order:
                 group_entries = tags_for_site[tag_label]
-                if sort_mode == "config":
-                    group_entries.sort(key=lambda item: item["host_id"])
-                elif sort_mode == "failures":
-                    group_entries.sort(key=lambda item: (item["fail_count"], item["label"]), reverse=True)
-                elif sort_mode == "streak":
-                    group_entries.sort(key=lambda item: (item["fail_streak"], item["label"]), reverse=True)
-                elif sort_mode == "latency":
-                    group_entries.sort(key=lambda item: ((item["latest_rtt"] or -1.0), item["label"]), reverse=True)
-                elif sort_mode == "host":
-                    group_entries.sort(key=lambda item: item["label"])
+                _sort_entries(group_entries, sort_mode)
                 site_ordered_entries.extend(group_entries)
         entries = site_ordered_entries
     elif group_sort_enabled and group_by != "none":
-        groups: Dict[str, List[Dict[str, Any]]] = {}
+        groups: Dict[str, List[DisplayEntry]] = {}
         for item in entries:
-            group_label = resolve_primary_group_label(info_by_id[item["host_id"]], group_by)
+            group_label = resolve_primary_group_label(info_by_id[item[ENTRY_HOST_ID]], group_by)
             groups.setdefault(group_label, []).append(item)
 
         group_order = list(groups.keys())
-        if sort_mode == "config":
-            group_order.sort(key=natural_sort_key)
-        elif sort_mode == "failures":
-            group_order.sort(
-                key=lambda label: (
-                    (
-                        sum(entry["fail_count"] for entry in groups[label])
-                        / max(1, sum(entry["total"] for entry in groups[label]))
-                    ),
-                    label,
-                ),
-                reverse=True,
-            )
-        elif sort_mode == "latency":
-            group_order.sort(
-                key=lambda label: (
-                    max((entry["latest_rtt"] or -1.0) for entry in groups[label]),
-                    label,
-                ),
-                reverse=True,
-            )
-        elif sort_mode == "streak":
-            group_order.sort(
-                key=lambda label: (
-                    max(entry["fail_streak"] for entry in groups[label]),
-                    label,
-                ),
-                reverse=True,
-            )
-        elif sort_mode == "host":
-            group_order.sort(key=natural_sort_key)
+        _sort_group_labels(group_order, groups, sort_mode)
 
-        ordered_entries: List[Dict[str, Any]] = []
+        ordered_entries: List[DisplayEntry] = []
         for label in group_order:
             group_entries = groups[label]
-            if sort_mode == "config":
-                group_entries.sort(key=lambda item: item["host_id"])
-            elif sort_mode == "failures":
-                group_entries.sort(key=lambda item: (item["fail_count"], item["label"]), reverse=True)
-            elif sort_mode == "streak":
-                group_entries.sort(key=lambda item: (item["fail_streak"], item["label"]), reverse=True)
-            elif sort_mode == "latency":
-                group_entries.sort(key=lambda item: ((item["latest_rtt"] or -1.0), item["label"]), reverse=True)
-            elif sort_mode == "host":
-                group_entries.sort(key=lambda item: item["label"])
+            _sort_entries(group_entries, sort_mode)
             ordered_entries.extend(group_entries)
         entries = ordered_entries
     else:
-        if sort_mode == "config":
-            # Sort by host_id to maintain configuration file order
-            entries.sort(key=lambda item: item["host_id"])
-        elif sort_mode == "failures":
-            entries.sort(key=lambda item: (item["fail_count"], item["label"]), reverse=True)
-        elif sort_mode == "streak":
-            entries.sort(key=lambda item: (item["fail_streak"], item["label"]), reverse=True)
-        elif sort_mode == "latency":
-            entries.sort(
-                key=lambda item: ((item["latest_rtt"] or -1.0), item["label"]),
-                reverse=True,
-            )
-        elif sort_mode == "host":
-            entries.sort(key=lambda item: item["label"])
+        _sort_entries(entries, sort_mode)
+
+    return [(entry[ENTRY_HOST_ID], entry[ENTRY_LABEL]) for entry in entries]
+
+
+def _sort_entries(entries: List[DisplayEntry], sort_mode: str) -> None:
+    """Sort display entries in place for the given sort mode."""
+    sort_spec = ENTRY_SORT_KEYS.get(sort_mode)
+    if sort_spec is not None:
+        key, reverse = sort_spec
+        entries.sort(key=key, reverse=reverse)
+
 
-    return [(entry["host_id"], entry["label"]) for entry in entries]
+def _group_failure_ratio(group_entries: Sequence[DisplayEntry]) -> float:
+    total = sum(entry[ENTRY_TOTAL] for entry in group_entries)
+    failures = sum(entry[ENTRY_FAIL_COUNT] for entry in group_entries)
+    return float(failures / max(1, total))
 
 
-def can_render_full_summary(summary_data: Sequence[Dict[str, Any]], width: int) -> bool:
+def _group_max_latency(group_entries: Sequence[DisplayEntry]) -> float:
+    return float(max(entry[ENTRY_LATENCY] for entry in group_entries))
+
+
+def _group_max_streak(group_entries: Sequence[DisplayEntry]) -> int:
+    return int(max(entry[ENTRY_FAIL_STREAK] for entry in group_entries))
+
+
+_GROUP_SORT_METRICS: Dict[str, Callable[[Sequence[DisplayEntry]], float]] = {
+    "failures": _group_failure_ratio,
+    "latency": _group_max_latency,
+    "streak": _group_max_streak,
+}
+
+
+def _sort_group_labels(
+    labels: List[str],
+    entries_by_label: Mapping[str, Sequence[DisplayEntry]],
+    sort_mode: str,
+) -> None:
+    """Sort group labels in place by their aggregate metric, or naturally by name."""
+    if sort_mode in ("config", "host"):
+        labels.sort(key=natural_sort_key)
+        return
+    metric = _GROUP_SORT_METRICS.get(sort_mode)
+    if metric is not None:
+        labels.sort(key=lambda label: (metric(entries_by_label[label]), label), reverse=True)
+
+
+def precompute_summary_suffixes(summary_data: Sequence[Dict[str, Any]]) -> List[str]:
+    """Build the combined summary suffix for each entry once per summary pass."""
+    return [build_summary_all_suffix(entry) for entry in summary_data]
+
+
+def can_render_full_summary(
+    summary_data: Sequence[Dict[str, Any]],
+    width: int,
+    all_suffixes: Optional[Sequence[str]] = None,
+) -> bool:
     """Check if we can render the full summary with all information."""
     if not summary_data:
         return False
-    max_suffix_len = max(len(build_summary_all_suffix(entry)) for entry in summary_data)
+    if all_suffixes is None:
+        all_suffixes = precompute_summary_suffixes(summary_data)
+    max_suffix_len = max(map(len, all_suffixes))
     return width >= max_suffix_len + 1
 
 
-def format_summary_line(entry: Dict[str, Any], width: int, summary_mode: str, prefer_all: bool = False) -> str:
-    """Format a single summary line."""
+def format_summary_line(
+    entry: Dict[str, Any],
+    width: int,
+    summary_mode: str,
+    prefer_all: bool = False,
+    all_suffix: Optional[str] = None,
+) -> str:
+    """Format a single summary line, reusing a precomputed combined suffix when given."""
     status_suffix = None
     if prefer_all:
-        all_suffix = build_summary_all_suffix(entry)
+        if all_suffix is None:
+            all_suffix = build_summary_all_suffix(entry)
         if width >= len(all_suffix) + 1:
             status_suffix = all_suffix
     if status_suffix is None:
@@ -1405,15 +1675,14 @@ def format_summary_line(entry: Dict[str, Any], width: int, summary_mode: str, pr
     indent = "  " * max(0, int(entry.get("indent_level", 0)))
     host_text = f"{indent}{entry['host']}"
     available_for_host = width - len(status_suffix)
-    if available_for_host > 0:
-        host_display = host_text[:available_for_host]
-    else:
-        host_display = host_text
-
-    full_line = f"{host_display}{status_suffix}"
-    return full_line[:width]
+    if available_for_host <= 0:
+        return f"{host_text}{status_suffix}"[:width]
+    if len(host_text) > available_for_host:
+        host_text = host_text[:available_for_host]
+    return host_text + status_suffix
 
 
+@lru_cache(maxsize=16)
 def build_time_axis(
     timeline_width: int,
     label_width: int,
@@ -1434,6 +1703,9 @@ def build_time_axis(
 
     Returns:
         Formatted axis string with padding and labels
+
+    The axis depends only on its arguments, so it is cached and rebuilt only
+    when the layout or ping interval changes.
     """
     if timeline_width <= 0:
         return ""
@@ -1442,34 +1714,22 @@ def build_time_axis(
     # The leftmost column is oldest, and the rightmost column is newest (0s ago).
     axis_chars = [" "] * timeline_width
 
-    # Place labels at regular intervals, checking for overlaps
-    for i in range(timeline_width):
+    # Labels are placed left to right, so only the previously placed label can
+    # collide with a new one; tracking where it ends replaces a per-column scan.
+    last_label_end = -1
+    for i in range(1, timeline_width):
         # Time from right (seconds ago), so rightmost column is 0s.
         time_from_right = (timeline_width - 1 - i) * interval_seconds
 
-        # Check if this position should have a label
         # We want labels at label_period, 2*label_period, ... from the right.
         # 0 is intentionally omitted.
-        if i > 0 and abs(time_from_right % label_period_seconds) < interval_seconds and time_from_right >= interval_seconds:
-            label_value = int(time_from_right)
-            label_str = str(label_value)
-
-            # Check if label fits and doesn't overlap with existing labels
-            if i + len(label_str) <= timeline_width:
-                # Check for overlap: ensure all positions (plus a one-char gap) are empty
-                overlap = False
-                start_index = max(0, i - 1)
-                end_index = min(timeline_width, i + len(label_str) + 1)
-                for j in range(start_index, end_index):
-                    if axis_chars[j] != " ":
-                        overlap = True
-                        break
-
-                # Place label only if no overlap
-                if not overlap:
-                    for j, char in enumerate(label_str):
-                        if i + j < timeline_width:
-                            axis_chars[i + j] = char
+        if abs(time_from_right % label_period_seconds) < interval_seconds and time_from_right >= interval_seconds:
+            label_str = str(int(time_from_right))
+            label_end = i + len(label_str)
+            # Require the label to fit and keep a one-char gap after the previous label.
+            if label_end <= timeline_width and last_label_end < i:
+                axis_chars[i:label_end] = label_str
+                last_label_end = label_end
 
     axis_timeline = "".join(axis_chars)
     # Add label padding and separator to match timeline format
@@ -1481,6 +1741,16 @@ def format_status_line(host: str, timeline: str, label_width: int) -> str:
     return f"{pad_visible(host, label_width)} | {timeline}"
 
 
+@lru_cache(maxsize=1024)
+def _row_label_prefix(label: str, status: Optional[str], use_color: bool, label_width: int) -> str:
+    """Return the colored, padded label and separator that start a host row.
+
+    Labels and statuses rarely change between frames, so each host's prefix is
+    formatted once and reused until its status or the label column changes.
+    """
+    return format_status_line(colorize_text(label, status, use_color), "", label_width)
+
+
 def _parse_positive_float(value: Optional[str]) -> Optional[float]:
     """Parse a strictly positive float from a string, returning None if invalid.
 
@@ -1523,12 +1793,13 @@ def build_status_metrics(
     host_count = len(host_infos) if host_infos else 0
     successful_pings = 0
     error_count = 0
-    stats_map = stats or {}
+    get_stats = (stats or {}).get
     for info in host_infos or []:
-        stat_entry = stats_map.get(info["id"], {})
+        stat_entry = get_stats(info["id"])
+        if stat_entry is None:
+            continue
         # Slow pings still represent successful responses for aggregate success counts.
-        total_successful = stat_entry.get("success", 0) + stat_entry.get("slow", 0)
-        successful_pings += total_successful
+        successful_pings += stat_entry.get("success", 0) + stat_entry.get("slow", 0)
         error_count += stat_entry.get("fail", 0)
     estimated_rate = estimate_ping_rate(host_count, interval_seconds)
     rate_label = f"{estimated_rate:.1f}/s" if estimated_rate is not None else "n/a"
@@ -1553,26 +1824,38 @@ def build_status_line(
     group_by: str = "none",
 ) -> str:
     """Build the status line showing current modes and settings."""
-    sort_labels = {
-        "failures": "Failure Count",
-        "streak": "Failure Streak",
-        "latency": "Latest Latency",
-        "host": "Host Name",
-    }
-    filter_labels = {
-        "failures": "Failures Only",
-        "latency": "High Latency Only",
-        "all": "All Items",
-    }
-    summary_labels = {
-        "rates": "Rates",
-        "rtt": "Avg RTT",
-        "ttl": "TTL",
-        "streak": "Streak",
-    }
-    sort_label = sort_labels.get(sort_mode, sort_mode)
-    filter_label = filter_labels.get(filter_mode, filter_mode)
-    summary_label = "All" if summary_all else summary_labels.get(summary_mode, summary_mode)
+    status = _status_mode_prefix(
+        sort_mode,
+        filter_mode,
+        summary_mode,
+        paused,
+        summary_all,
+        summary_fullscreen,
+        dormant,
+        summary_scope,
+        group_by,
+    )
+    if status_message:
+        status += f" | {status_message}"
+    return status
+
+
+@lru_cache(maxsize=64)
+def _status_mode_prefix(
+    sort_mode: str,
+    filter_mode: str,
+    summary_mode: str,
+    paused: bool,
+    summary_all: bool,
+    summary_fullscreen: bool,
+    dormant: bool,
+    summary_scope: str,
+    group_by: str,
+) -> str:
+    """Build the mode part of the status line; it only changes on user toggles, so it is cached."""
+    sort_label = _SORT_LABELS.get(sort_mode, sort_mode)
+    filter_label = _FILTER_LABELS.get(filter_mode, filter_mode)
+    summary_label = "All" if summary_all else _SUMMARY_LABELS.get(summary_mode, summary_mode)
     status = f"Sort: {sort_label} | Filter: {filter_label} | Summary: {summary_label}"
     if summary_scope == "group":
         status += f" | Group: {group_by}"
@@ -1582,8 +1865,6 @@ def build_status_line(
         status += " | DORMANT"
     elif paused:
         status += " | PAUSED"
-    if status_message:
-        status += f" | {status_message}"
     return status
 
 
@@ -1725,13 +2006,18 @@ def resolve_group_header_lines(
     return [], current_primary_group, current_tree_group
 
 
-def render_timeline_view(
+# Builds one host's row body from its buffers, right-justified to the timeline width.
+HostRowBuilder = Callable[[Dict[str, Any], Dict[str, str], bool], Tuple[str, int]]
+
+
+def _render_host_rows_view(
     display_entries: Sequence[Tuple[Any, ...]],
     buffers: Dict[int, Dict[str, Any]],
     symbols: Dict[str, str],
     width: int,
     height: int,
     header: str,
+    row_builder: HostRowBuilder,
     use_color: bool = False,
     scroll_offset: int = 0,
     header_lines: int = 2,
@@ -1743,7 +2029,7 @@ def render_timeline_view(
     group_header_lines: Optional[Mapping[str, Union[str, List[str]]]] = None,
     group_by: str = "none",
 ) -> List[str]:
-    """Render the timeline view."""
+    """Render the per-host row layout shared by the timeline, sparkline, and square views."""
     if width <= 0 or height <= 0:
         return []
 
@@ -1773,7 +2059,7 @@ def render_timeline_view(
 
     lines = []
     lines.append(header)
-    lines.append("".join("-" for _ in range(render_width)))
+    lines.append(_dash_line(render_width))
     current_primary_group = None
     current_tree_group = None
     for entry in truncated_entries:
@@ -1793,14 +2079,14 @@ def render_timeline_view(
             )
             for header_line in header_stack:
                 lines.append(header_line[:render_width])
-        timeline_symbols = list(buffers[host]["timeline"])
-        timeline = build_colored_timeline(timeline_symbols, symbols, use_color)
-        timeline = rjust_visible(timeline, timeline_width)
-        label_status = resolve_host_label_status(timeline_symbols, symbols, is_removed=is_removed)
-        colored_label = colorize_text(label, label_status, use_color)
-        lines.append(format_status_line(colored_label, timeline, label_width))
-
-    # Add time axis at the bottom of the timeline area
+        # resize_buffers caps every buffer at timeline_width, so the deques are read as-is.
+        host_buffers = buffers[host]
+        body, body_width = row_builder(host_buffers, symbols, use_color)
+        label_status = resolve_host_label_status(host_buffers["timeline"], symbols, is_removed=is_removed)
+        prefix = _row_label_prefix(label, label_status, use_color, label_width)
+        lines.append(_compose_row(prefix, body, body_width, timeline_width))
+
+    # Add time axis at the bottom of the host rows
     time_axis = build_time_axis(timeline_width, label_width, interval_seconds=interval_seconds)
     lines.append(time_axis)
 
@@ -1813,6 +2099,68 @@ def render_timeline_view(
     return pad_lines(lines, width, height)
 
 
+def _timeline_row(host_buffers: Dict[str, Any], symbols: Dict[str, str], use_color: bool) -> Tuple[str, int]:
+    """Build a host's timeline row and its visible width."""
+    timeline_symbols = host_buffers["timeline"]
+    # Every status symbol is one cell wide, so the colored row spans one cell per symbol.
+    return build_colored_timeline(timeline_symbols, symbols, use_color), len(timeline_symbols)
+
+
+def _sparkline_row(host_buffers: Dict[str, Any], symbols: Dict[str, str], use_color: bool) -> Tuple[str, int]:
+    """Build a host's sparkline row and its visible width."""
+    status_symbols = host_buffers["timeline"]
+    sparkline = build_sparkline(host_buffers["rtt_history"], status_symbols, symbols["fail"])
+    # Coloring pairs each bar with its status, so a colored row is as wide as the shorter sequence.
+    sparkline_width = min(len(sparkline), len(status_symbols)) if use_color else len(sparkline)
+    return build_colored_sparkline(sparkline, status_symbols, symbols, use_color), sparkline_width
+
+
+def _square_row(host_buffers: Dict[str, Any], symbols: Dict[str, str], use_color: bool) -> Tuple[str, int]:
+    """Build a host's square timeline row and its visible width."""
+    timeline_symbols = host_buffers["timeline"]
+    return build_colored_square_timeline(timeline_symbols, symbols, use_color), len(timeline_symbols)
+
+
+def render_timeline_view(
+    display_entries: Sequence[Tuple[Any, ...]],
+    buffers: Dict[int, Dict[str, Any]],
+    symbols: Dict[str, str],
+    width: int,
+    height: int,
+    header: str,
+    use_color: bool = False,
+    scroll_offset: int = 0,
+    header_lines: int = 2,
+    boxed: bool = False,
+    interval_seconds: float = 1.0,
+    show_group_headers: bool = False,
+    host_group_labels: Optional[Dict[int, str]] = None,
+    host_tree_labels: Optional[Dict[int, str]] = None,
+    group_header_lines: Optional[Mapping[str, Union[str, List[str]]]] = None,
+    group_by: str = "none",
+) -> List[str]:
+    """Render the timeline view."""
+    return _render_host_rows_view(
+        display_entries,
+        buffers,
+        symbols,
+        width,
+        height,
+        header,
+        _timeline_row,
+        use_color=use_color,
+        scroll_offset=scroll_offset,
+        header_lines=header_lines,
+        boxed=boxed,
+        interval_seconds=interval_seconds,
+        show_group_headers=show_group_headers,
+        host_group_labels=host_group_labels,
+        host_tree_labels=host_tree_labels,
+        group_header_lines=group_header_lines,
+        group_by=group_by,
+    )
+
+
 def render_sparkline_view(
     display_entries: Sequence[Tuple[Any, ...]],
     buffers: Dict[int, Dict[str, Any]],
@@ -1832,118 +2180,92 @@ def render_sparkline_view(
     group_by: str = "none",
 ) -> List[str]:
     """Render the sparkline view."""
-    if width <= 0 or height <= 0:
-        return []
-
-    render_width, render_height, can_box = resolve_boxed_dimensions(width, height, boxed)
-    label_overrides = build_group_tree_label_map(
+    return _render_host_rows_view(
         display_entries,
+        buffers,
+        symbols,
+        width,
+        height,
+        header,
+        _sparkline_row,
+        use_color=use_color,
+        scroll_offset=scroll_offset,
+        header_lines=header_lines,
+        boxed=boxed,
+        interval_seconds=interval_seconds,
         show_group_headers=show_group_headers,
         host_group_labels=host_group_labels,
         host_tree_labels=host_tree_labels,
+        group_header_lines=group_header_lines,
         group_by=group_by,
     )
-    host_labels = [
-        label_overrides.get(entry[0], str(entry[1]) if len(entry) >= 2 else str(entry[0])) for entry in display_entries
-    ]
-    # Account for time axis line when calculating visible hosts
-    # header_lines + 1 for the time axis line
-    render_width, label_width, timeline_width, visible_hosts = compute_main_layout(
-        host_labels, render_width, render_height, header_lines + 1
-    )
-    reserve_overflow_line = len(display_entries) > visible_hosts
-    host_capacity = max(1, visible_hosts - 1) if reserve_overflow_line else visible_hosts
-    max_offset = max(0, len(display_entries) - host_capacity)
-    scroll_offset = min(max(scroll_offset, 0), max_offset)
-    truncated_entries = display_entries[scroll_offset : scroll_offset + host_capacity]
 
-    resize_buffers(buffers, timeline_width, symbols)
 
-    lines = []
-    lines.append(header)
-    lines.append("".join("-" for _ in range(render_width)))
-    current_primary_group = None
-    current_tree_group = None
-    for entry in truncated_entries:
-        host = entry[0]
-        base_label = str(entry[1]) if len(entry) >= 2 else str(entry[0])
-        label = label_overrides.get(host, base_label)
-        is_removed = "[REMOVED]" in label
-        if show_group_headers:
-            header_stack, current_primary_group, current_tree_group = resolve_group_header_lines(
-                host,
-                group_by,
-                current_primary_group,
-                current_tree_group,
-                host_group_labels,
-                host_tree_labels,
-                group_header_lines,
-            )
-            for header_line in header_stack:
-                lines.append(header_line[:render_width])
-        rtt_values = list(buffers[host]["rtt_history"])[-timeline_width:]
-        status_symbols = list(buffers[host]["timeline"])[-timeline_width:]
-        sparkline = build_sparkline(rtt_values, status_symbols, symbols["fail"])
-        sparkline = build_colored_sparkline(sparkline, status_symbols, symbols, use_color)
-        sparkline = rjust_visible(sparkline, timeline_width)
-        label_status = resolve_host_label_status(status_symbols, symbols, is_removed=is_removed)
-        colored_label = colorize_text(label, label_status, use_color)
-        lines.append(format_status_line(colored_label, sparkline, label_width))
-
-    # Add time axis at the bottom of the sparkline area
-    time_axis = build_time_axis(timeline_width, label_width, interval_seconds=interval_seconds)
-    lines.append(time_axis)
+def _build_square_style_table(symbols: Dict[str, str], use_color: bool) -> Tuple[Dict[str, Tuple[str, str]], Tuple[str, str]]:
+    """Map each status symbol to its square (color, glyph), plus the pending fallback."""
+    return _square_style_items(tuple(symbols.items()), use_color)
 
-    if len(display_entries) > len(truncated_entries):
-        remaining = len(display_entries) - len(truncated_entries)
-        lines.append(f"... ({remaining} host(s) not shown)")
 
-    if can_box:
-        return box_lines(lines, width, height)
-    return pad_lines(lines, width, height)
-
-
-def build_colored_square_timeline(timeline_symbols: Sequence[str], symbols: Dict[str, str], use_color: bool) -> str:
-    """Build a colored timeline of squares from status symbols."""
+@lru_cache(maxsize=8)
+def _square_style_items(
+    symbol_items: Tuple[Tuple[str, str], ...], use_color: bool
+) -> Tuple[Dict[str, Tuple[str, str]], Tuple[str, str]]:
+    """Build the square style table for a frozen symbol set."""
     # Square view uses different colors than timeline view:
     # - Square view: green for OK (success/slow), red for fail, gray for pending
     # - Timeline view: white for success, yellow for slow, red for fail
     # Green is not in STATUS_COLORS because timeline uses white for success
     green_color = "\x1b[32m"  # Green for OK status
     gray_color = "\x1b[37m"  # Gray for pending/unknown
+    square = "■"
+
+    # OK = success or slow (green), NG = fail (red), pending = pending (gray)
+    # In monochrome mode, use different symbols to distinguish statuses:
+    # - fail: blank space (clearly shows failure)
+    # - success/slow: solid square (shows success)
+    # - pending: dash/hyphen (shows pending)
+    if use_color:
+        fail_style = (STATUS_COLORS["fail"], square)
+        ok_style = (green_color, square)
+        pending_style = (gray_color, square)
+    else:
+        fail_style = ("", " ")  # Blank for failed ping in monochrome
+        ok_style = ("", square)  # Solid square for success in monochrome
+        pending_style = ("", "-")  # Dash for pending in monochrome
 
-    squares = []
-    for symbol in timeline_symbols:
-        status = status_from_symbol(symbol, symbols)
-        square = "■"
-
-        # Determine square color based on status
-        # OK = success or slow (green), NG = fail (red), pending = pending (gray)
-        # In monochrome mode, use different symbols to distinguish statuses:
-        # - fail: blank space (clearly shows failure)
-        # - success/slow: solid square (shows success)
-        # - pending: dash/hyphen (shows pending)
+    table = {}
+    for symbol, status in _invert_symbol_items(symbol_items).items():
         if status == "fail":
-            if use_color:
-                colored_square = f"{STATUS_COLORS['fail']}{square}{ANSI_RESET}"
-            else:
-                colored_square = " "  # Blank for failed ping in monochrome
+            table[symbol] = fail_style
         elif status in ("success", "slow"):
             # success and slow both show green square (OK status)
-            if use_color:
-                colored_square = f"{green_color}{square}{ANSI_RESET}"
-            else:
-                colored_square = square  # Solid square for success in monochrome
+            table[symbol] = ok_style
         else:
-            # pending or None status - show pending square
-            if use_color:
-                colored_square = f"{gray_color}{square}{ANSI_RESET}"
-            else:
-                colored_square = "-"  # Dash for pending in monochrome
+            table[symbol] = pending_style
+    return table, pending_style
 
-        squares.append(colored_square)
 
-    return "".join(squares)
+@lru_cache(maxsize=4)
+def _square_glyph_items(symbol_items: Tuple[Tuple[str, str], ...]) -> Tuple[Dict[str, str], str]:
+    """Build the monochrome symbol -> square glyph map for a frozen symbol set."""
+    table, (_, pending_glyph) = _square_style_items(symbol_items, False)
+    return {symbol: glyph for symbol, (_, glyph) in table.items()}, pending_glyph
+
+
+def build_colored_square_timeline(timeline_symbols: Sequence[str], symbols: Dict[str, str], use_color: bool) -> str:
+    """Build a colored timeline of squares from status symbols."""
+    if not use_color:
+        # Monochrome squares carry no escape codes, so each cell maps straight to its glyph.
+        glyphs, pending_glyph = _square_glyph_items(tuple(symbols.items()))
+        return "".join([glyphs.get(symbol, pending_glyph) for symbol in timeline_symbols])
+    # Resolve the handful of distinct styles once, then emit one color span per
+    # run of same-styled squares instead of wrapping every square.
+    table, pending_style = _build_square_style_table(symbols, use_color)
+    spans = []
+    for (color, glyph), run in groupby(timeline_symbols, key=lambda symbol: table.get(symbol, pending_style)):
+        cells = glyph * sum(1 for _ in run)
+        spans.append(f"{color}{cells}{ANSI_RESET}" if color else cells)
+    return "".join(spans)
 
 
 def render_square_view(
@@ -1965,75 +2287,25 @@ def render_square_view(
     group_by: str = "none",
 ) -> List[str]:
     """Render the square view as a time-series (horizontal sequence of colored squares)."""
-    if width <= 0 or height <= 0:
-        return []
-
-    render_width, render_height, can_box = resolve_boxed_dimensions(width, height, boxed)
-    label_overrides = build_group_tree_label_map(
+    return _render_host_rows_view(
         display_entries,
+        buffers,
+        symbols,
+        width,
+        height,
+        header,
+        _square_row,
+        use_color=use_color,
+        scroll_offset=scroll_offset,
+        header_lines=header_lines,
+        boxed=boxed,
+        interval_seconds=interval_seconds,
         show_group_headers=show_group_headers,
         host_group_labels=host_group_labels,
         host_tree_labels=host_tree_labels,
+        group_header_lines=group_header_lines,
         group_by=group_by,
     )
-    host_labels = [
-        label_overrides.get(entry[0], str(entry[1]) if len(entry) >= 2 else str(entry[0])) for entry in display_entries
-    ]
-    # Account for time axis line when calculating visible hosts
-    # header_lines + 1 for the time axis line
-    render_width, label_width, timeline_width, visible_hosts = compute_main_layout(
-        host_labels, render_width, render_height, header_lines + 1
-    )
-    reserve_overflow_line = len(display_entries) > visible_hosts
-    host_capacity = max(1, visible_hosts - 1) if reserve_overflow_line else visible_hosts
-    max_offset = max(0, len(display_entries) - host_capacity)
-    scroll_offset = min(max(scroll_offset, 0), max_offset)
-    truncated_entries = display_entries[scroll_offset : scroll_offset + host_capacity]
-
-    resize_buffers(buffers, timeline_width, symbols)
-
-    lines = []
-    lines.append(header)
-    lines.append("".join("-" for _ in range(render_width)))
-
-    current_primary_group = None
-    current_tree_group = None
-    for entry in truncated_entries:
-        host = entry[0]
-        base_label = str(entry[1]) if len(entry) >= 2 else str(entry[0])
-        label = label_overrides.get(host, base_label)
-        is_removed = "[REMOVED]" in label
-        if show_group_headers:
-            header_stack, current_primary_group, current_tree_group = resolve_group_header_lines(
-                host,
-                group_by,
-                current_primary_group,
-                current_tree_group,
-                host_group_labels,
-                host_tree_labels,
-                group_header_lines,
-            )
-            for header_line in header_stack:
-                lines.append(header_line[:render_width])
-        timeline_symbols = list(buffers[host]["timeline"])
-        # Build colored square timeline from all timeline symbols
-        square_timeline = build_colored_square_timeline(timeline_symbols, symbols, use_color)
-        square_timeline = rjust_visible(square_timeline, timeline_width)
-        label_status = resolve_host_label_status(timeline_symbols, symbols, is_removed=is_removed)
-        colored_label = colorize_text(label, label_status, use_color)
-        lines.append(format_status_line(colored_label, square_timeline, label_width))
-
-    # Add time axis at the bottom of the square timeline area
-    time_axis = build_time_axis(timeline_width, label_width, interval_seconds=interval_seconds)
-    lines.append(time_axis)
-
-    if len(display_entries) > len(truncated_entries):
-        remaining = len(display_entries) - len(truncated_entries)
-        lines.append(f"... ({remaining} host(s) not shown)")
-
-    if can_box:
-        return box_lines(lines, width, height)
-    return pad_lines(lines, width, height)
 
 
 def render_main_view(
@@ -2146,21 +2418,21 @@ def render_summary_view(
     summary_mode: str,
     prefer_all: bool = False,
     boxed: bool = False,
+    all_suffixes: Optional[Sequence[str]] = None,
+    all_fits: Optional[bool] = None,
 ) -> List[str]:
     """Render the summary view."""
     if width <= 0 or height <= 0:
         return []
 
     render_width, _, can_box = resolve_boxed_dimensions(width, height, boxed)
-    mode_labels = {
-        "rates": "Rates",
-        "rtt": "Avg RTT",
-        "ttl": "TTL",
-        "streak": "Streak",
-    }
-    allow_all = prefer_all and can_render_full_summary(summary_data, render_width)
-    mode_label = "All" if allow_all else mode_labels.get(summary_mode, "Rates")
-    lines = [f"Summary ({mode_label})", "-" * render_width]
+    if prefer_all and all_suffixes is None:
+        all_suffixes = precompute_summary_suffixes(summary_data)
+    if all_fits is None:
+        all_fits = can_render_full_summary(summary_data, render_width, all_suffixes) if prefer_all else False
+    allow_all = prefer_all and all_fits
+    mode_label = "All" if allow_all else _SUMMARY_LABELS.get(summary_mode, "Rates")
+    lines = [f"Summary ({mode_label})", _dash_line(render_width)]
 
     # Add legend for Rates mode explaining Snt/Rcv/Los
     # Show legend when displaying rates mode (standalone) or all mode (which includes rates)
@@ -2170,8 +2442,12 @@ def render_summary_view(
         if len(legend) <= render_width:
             lines.append(legend)
 
-    for entry in summary_data:
-        lines.append(format_summary_line(entry, render_width, summary_mode, prefer_all=allow_all))
+    if allow_all and all_suffixes is not None:
+        for entry, all_suffix in zip(summary_data, all_suffixes):
+            lines.append(format_summary_line(entry, render_width, summary_mode, prefer_all=True, all_suffix=all_suffix))
+    else:
+        for entry in summary_data:
+            lines.append(format_summary_line(entry, render_width, summary_mode))
 
     if can_box:
         return box_lines(lines, width, height)
@@ -2180,10 +2456,16 @@ def render_summary_view(
 
 def render_help_view(width: int, height: int, boxed: bool = False) -> List[str]:
     """Render the help view."""
+    return list(_help_view_lines(width, height, boxed))
+
+
+@lru_cache(maxsize=4)
+def _help_view_lines(width: int, height: int, boxed: bool) -> Tuple[str, ...]:
+    """Lay out the help text; it depends only on the static keymap and the view size."""
     render_width, render_height, can_box = resolve_boxed_dimensions(width, height, boxed)
     header_lines = [
         "ParaPing - Help",
-        "-" * render_width,
+        _dash_line(render_width),
     ]
     help_items = build_help_items()
 
@@ -2220,8 +2502,8 @@ def render_help_view(width: int, height: int, boxed: bool = False) -> List[str]:
         lines.extend(single_column)
 
     if can_box:
-        return box_lines(lines, width, height)
-    return pad_lines(lines, width, height)
+        return tuple(box_lines(lines, width, height))
+    return tuple(pad_lines(lines, width, height))
 
 
 def render_host_selection_view(
@@ -2236,7 +2518,7 @@ def render_host_selection_view(
         return []
 
     title = f"Select Host for RTT Graph [{mode_label}]"
-    lines = [title[:width], "-" * width]
+    lines = [title[:width], _dash_line(width)]
     status_line = "j/k or ↑/↓: move | Enter: select | ESC: cancel"
     list_height = max(0, height - 3)
 
@@ -2291,12 +2573,13 @@ def render_fullscreen_rtt_graph(
     graph_label = "Bar" if graph_style == "bar" else "Line"
     header = f"ParaPing - {pause_label} RTT Graph " f"[{host_label} | {graph_label}] {timestamp}"
 
-    rtt_ms = [value * 1000 if value is not None else None for value in rtt_values]
-    numeric_values = [value for value in rtt_ms if value is not None]
+    # Scaling to ms is monotonic, so the range is taken in seconds and only the
+    # three summary values and the resampled points are converted.
+    numeric_values = [value for value in rtt_values if value is not None]
     if numeric_values:
-        min_val = min(numeric_values)
-        max_val = max(numeric_values)
-        latest_val = numeric_values[-1]
+        min_val = min(numeric_values) * 1000
+        max_val = max(numeric_values) * 1000
+        latest_val = numeric_values[-1] * 1000
         range_line = "RTT range (Y-axis, ms): " f"{min_val:.1f}-{max_val:.1f} | latest: {latest_val:.1f}"
     else:
         min_val = max_val = 0.0
@@ -2313,7 +2596,7 @@ def render_fullscreen_rtt_graph(
     graph_width = max(1, width - y_axis_width - 3)
 
     graph_height = max(0, height - 5)
-    resampled_values = resample_values(rtt_ms, graph_width)
+    resampled_values = [value * 1000 if value is not None else None for value in resample_values(rtt_values, graph_width)]
     resampled_times = resample_values(time_history, graph_width)
     graph_lines = build_ascii_graph(resampled_values, graph_width, graph_height, style=graph_style)
     if not numeric_values and graph_height > 0:
@@ -2322,21 +2605,19 @@ def render_fullscreen_rtt_graph(
         mid = graph_height // 2
         graph_lines[mid] = message_line
 
-    y_tick_positions = {
-        0: y_tick_labels[0],
-        max(0, graph_height // 2): y_tick_labels[1],
-        max(0, graph_height - 1): y_tick_labels[2],
-    }
-
-    lines = [header[:width], range_line[:width], "-" * width]
-    for idx, line in enumerate(graph_lines):
-        label = y_tick_positions.get(idx, "")
-        label_text = label.rjust(y_axis_width)
-        lines.append(f"{label_text} | {line}".ljust(width)[:width])
-
-    time_values = [value for value in resampled_times if value is not None]
-    if time_values:
-        oldest_time = next(value for value in resampled_times if value is not None)
+    # One prebuilt axis prefix per graph row; later ticks win when rows coincide.
+    y_axis_prefixes = [f"{'':>{y_axis_width}} | "] * graph_height
+    if graph_height > 0:
+        for row, label in zip((0, graph_height // 2, graph_height - 1), y_tick_labels):
+            y_axis_prefixes[row] = f"{label:>{y_axis_width}} | "
+
+    lines = [header[:width], range_line[:width], _dash_line(width)]
+    for prefix, line in zip(y_axis_prefixes, graph_lines):
+        lines.append(f"{prefix}{line}".ljust(width)[:width])
+
+    # Only the endpoints matter, so scan in from each end instead of filtering the whole list.
+    oldest_time = next((value for value in resampled_times if value is not None), None)
+    if oldest_time is not None:
         latest_time = next(value for value in reversed(resampled_times) if value is not None)
         oldest_age = max(0, int(round(latest_time - oldest_time)))
         x_axis_line = "X-axis (seconds ago, oldest→newest): " f"{oldest_age}s → 0s"
@@ -2356,7 +2637,7 @@ def render_status_box(status_line: str, width: int) -> List[str]:
         return [status_line[:width]]
     inner_width = width - 2
     content = pad_visible(status_line[:inner_width], inner_width)
-    border = "-" * inner_width
+    border = _dash_line(inner_width)
     return [f"+{border}+", f"|{content}|", f"+{border}+"]
 
 
@@ -2477,15 +2758,27 @@ def build_display_lines(  # noqa: C901
             ordered_group_labels=group_order,
         )
     summary_source = group_summary_data if summary_scope == "group" and group_by != "none" else summary_data
-    if not summary_fullscreen and resolved_position in ("top", "bottom") and summary_height > 0:
+    # Built once per frame and shared by every full-summary width check and the summary renderer.
+    summary_suffixes = precompute_summary_suffixes(summary_source)
+    # The full-summary decision depends only on the summary render width, so it is made once
+    # here and handed to the height bounds and the renderer instead of being re-checked by each.
+    if summary_fullscreen:
+        summary_render_width = resolve_boxed_dimensions(term_width, panel_height, use_panel_boxes)[0]
+        summary_all = can_render_full_summary(summary_source, summary_render_width, summary_suffixes)
+    else:
         summary_render_width = _summary_render_width(summary_width, use_panel_boxes)
-        summary_all_for_height = can_render_full_summary(summary_source, summary_render_width)
+        summary_all = resolved_position in ("top", "bottom") and can_render_full_summary(
+            summary_source, summary_render_width, summary_suffixes
+        )
+    if not summary_fullscreen and resolved_position in ("top", "bottom") and summary_height > 0:
         content_height, minimal_height = compute_summary_height_bounds(
             summary_source,
             summary_mode,
-            summary_all_for_height,
+            summary_all,
             summary_width,
             boxed=use_panel_boxes,
+            all_suffixes=summary_suffixes,
+            all_fits=summary_all,
         )
         max_summary_height = max(0, panel_height - min_main_height - gap_size)
         summary_height = min(summary_height, content_height, max_summary_height)
@@ -2500,11 +2793,9 @@ def build_display_lines(  # noqa: C901
             timeline = buffers.get(info["id"], {}).get("timeline")
             if timeline and timeline[-1] == fail_symbol:
                 kitt_error_hosts += 1
-    summary_all = False
     main_lines = []
     summary_lines = []
     if summary_fullscreen:
-        summary_all = can_render_full_summary(summary_source, term_width)
         summary_lines = render_summary_view(
             summary_source,
             term_width,
@@ -2512,6 +2803,8 @@ def build_display_lines(  # noqa: C901
             summary_mode,
             prefer_all=summary_all,
             boxed=use_panel_boxes,
+            all_suffixes=summary_suffixes,
+            all_fits=summary_all,
         )
     else:
         main_lines = render_main_view(
@@ -2539,8 +2832,6 @@ def build_display_lines(  # noqa: C901
             kitt_style=kitt_style,
             group_by=group_by,
         )
-        summary_render_width = _summary_render_width(summary_width, use_panel_boxes)
-        summary_all = resolved_position in ("top", "bottom") and can_render_full_summary(summary_source, summary_render_width)
         summary_lines = render_summary_view(
             summary_source,
             summary_width,
@@ -2548,6 +2839,8 @@ def build_display_lines(  # noqa: C901
             summary_mode,
             prefer_all=summary_all,
             boxed=use_panel_boxes,
+            all_suffixes=summary_suffixes,
+            all_fits=summary_all,
         )
 
     gap = " "
@@ -2709,11 +3002,10 @@ def render_display(  # noqa: C901
         return
 
     if LAST_RENDER_LINES is None:
-        sys.stdout.write("\x1b[2J\x1b[H")
-        output_chunks = []
-        for index, line in enumerate(combined_lines):
-            output_chunks.append(f"\x1b[{index + 1};1H\x1b[2K{line}")
-        sys.stdout.write("".join(output_chunks))
+        # Clear and draw the whole frame in one write. Every row is positioned
+        # absolutely, so a row that renders wider than the terminal cannot shift
+        # the rows below it.
+        sys.stdout.write("\x1b[2J" + "".join([f"\x1b[{index + 1};1H{line}" for index, line in enumerate(combined_lines)]))
         sys.stdout.flush()
         LAST_RENDER_LINES = combined_lines
         return
@@ -2728,21 +3020,15 @@ def render_display(  # noqa: C901
         current_line = combined_lines[index] if index < len(combined_lines) else ""
         if previous_line == current_line and index < len(combined_lines):
             continue
-        if previous_line is None:
+        if previous_line is None or not current_line or (pulse_start is not None and index >= pulse_start):
             output_chunks.append(f"\x1b[{index + 1};1H\x1b[2K{current_line}")
-            continue
-        if not current_line:
-            output_chunks.append(f"\x1b[{index + 1};1H\x1b[2K")
-            continue
-        if pulse_start is not None and index >= pulse_start:
-            output_chunks.append(f"\x1b[{index + 1};1H\x1b[2K{current_line}")
-            continue
-        diff_start = _find_safe_diff_start(previous_line, current_line)
-        if diff_start <= 0:
-            output_chunks.append(f"\x1b[{index + 1};1H{current_line}\x1b[K")
-            continue
-        col = visible_cell_width(current_line[:diff_start]) + 1
-        output_chunks.append(f"\x1b[{index + 1};{col}H{current_line[diff_start:]}\x1b[K")
+        else:
+            diff_start = _find_safe_diff_start(previous_line, current_line)
+            if diff_start <= 0:
+                output_chunks.append(f"\x1b[{index + 1};1H{current_line}\x1b[K")
+            else:
+                col = visible_cell_width(current_line[:diff_start]) + 1
+                output_chunks.append(f"\x1b[{index + 1};{col}H{current_line[diff_start:]}\x1b[K")
 
     if output_chunks:
         sys.stdout.write("".join(output_chunks))
@@ -2755,6 +3041,8 @@ def reset_render_cache() -> None:
     """Force the next render call to redraw the full frame."""
     global LAST_RENDER_LINES
     LAST_RENDER_LINES = None
+    TERMINAL_SIZE_STATE["dirty"] = True
+    mark_display_names_dirty()
     KITT_SCANNER_STATE["last_monotonic"] = -1.0
     KITT_SCANNER_STATE["scanner_phase"] = 0.0
     KITT_SCANNER_STATE["last_error_ratio"] = 0.0
@@ -2763,7 +3051,8 @@ def reset_render_cache() -> None:
 def _find_pulse_start(lines: Sequence[str]) -> Optional[int]:
     """Return the first Pulse band line index if present."""
     for index, line in enumerate(lines):
-        if strip_ansi(line).startswith("Pulse ["):
+        # The header text is never colorized, so a substring check skips stripping most lines.
+        if "Pulse [" in line and strip_ansi(line).startswith("Pulse ["):
             return index
     return None
 
@@ -2801,8 +3090,8 @@ def _rewind_to_escape_boundary(text: str, index: int) -> int:
 
 def format_timezone_label(now_utc: datetime, display_tz: tzinfo) -> str:
     """Format the timezone label for display."""
-    tzinfo = now_utc.astimezone(display_tz).tzinfo
-    tz_name = tzinfo.tzname(now_utc) if tzinfo else None
+    # Ask the localized datetime, so zone rules see local wall time rather than UTC.
+    tz_name = now_utc.astimezone(display_tz).tzname()
     if tz_name:
         return tz_name
     tz_key = getattr(display_tz, "key", None)
@@ -2814,8 +3103,13 @@ def format_timezone_label(now_utc: datetime, display_tz: tzinfo) -> str:
 def format_timestamp(now_utc: datetime, display_tz: tzinfo) -> str:
     """Format a timestamp with timezone label."""
     timestamp = now_utc.astimezone(display_tz).strftime("%Y-%m-%d %H:%M:%S")
-    tz_label = format_timezone_label(now_utc, display_tz)
-    return f"{timestamp} ({tz_label})"
+    # Zone names only change at DST transitions, which fall on whole minutes,
+    # so the label is resolved once per minute rather than on every frame.
+    cache_key = (display_tz, int(now_utc.timestamp()) // 60)
+    if TIMEZONE_LABEL_CACHE["key"] != cache_key:
+        TIMEZONE_LABEL_CACHE["label"] = format_timezone_label(now_utc, display_tz)
+        TIMEZONE_LABEL_CACHE["key"] = cache_key
+    return f"{timestamp} ({TIMEZONE_LABEL_CACHE['label']})"
 
 
 # ============================================================================
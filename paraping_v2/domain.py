@@ -31,6 +31,11 @@ class HostStats:
     rtt_sum: float = 0.0
     rtt_sum_sq: float = 0.0
     rtt_count: int = 0
+    streak_type: Optional[str] = None
+    streak_length: int = 0
+    # Sum of |rtt[i] - rtt[i-1]| over adjacent replies in the timeline window.
+    jitter_sum: float = 0.0
+    jitter_pairs: int = 0
 
 
 @dataclass(frozen=True)
@@ -8,7 +8,7 @@ without terminal rendering concerns.
 from collections import deque
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Deque, Dict, Optional
+from typing import Deque, Dict, Optional, Tuple
 
 from paraping_v2.domain import HostStats, PingEvent
 
@@ -22,6 +22,8 @@ class HostTimeline:
     rtt_history: Deque[Optional[float]]
     time_history: Deque[float]
     ttl_history: Deque[Optional[int]]
+    # Length of the same-kind (success/fail) run ending at each slot; 0 for pending.
+    streak_runs: Deque[int]
     pending_by_sequence: Dict[int, int] = field(default_factory=dict)
 
 
@@ -38,6 +40,11 @@ class MonitorState:
     def __init__(self, host_ids: list[int], timeline_width: int = 120) -> None:
         width = max(1, int(timeline_width))
         self._symbols = {"sent": "-", "success": ".", "slow": "!", "fail": "x"}
+        self._streak_kinds = {
+            self._symbols["success"]: "success",
+            self._symbols["slow"]: "success",
+            self._symbols["fail"]: "fail",
+        }
         self.timelines: Dict[int, HostTimeline] = {
             host_id: HostTimeline(
                 symbols=deque(maxlen=width),
@@ -45,6 +52,7 @@ class MonitorState:
                 rtt_history=deque(maxlen=width),
                 time_history=deque(maxlen=width),
                 ttl_history=deque(maxlen=width),
+                streak_runs=deque(maxlen=width),
             )
             for host_id in host_ids
         }
@@ -66,6 +74,7 @@ class MonitorState:
             dst_timeline.rtt_history = deque(src_timeline.rtt_history, maxlen=src_timeline.rtt_history.maxlen)
             dst_timeline.time_history = deque(src_timeline.time_history, maxlen=src_timeline.time_history.maxlen)
             dst_timeline.ttl_history = deque(src_timeline.ttl_history, maxlen=src_timeline.ttl_history.maxlen)
+            dst_timeline.streak_runs = deque(src_timeline.streak_runs, maxlen=src_timeline.streak_runs.maxlen)
             dst_timeline.pending_by_sequence = deepcopy(src_timeline.pending_by_sequence)
             cloned.stats[host_id] = deepcopy(self.stats[host_id])
 
@@ -85,6 +94,7 @@ class MonitorState:
             rtt_history=deque(maxlen=width),
             time_history=deque(maxlen=width),
             ttl_history=deque(maxlen=width),
+            streak_runs=deque(maxlen=width),
         )
         self.stats[host_id] = HostStats()
 
@@ -108,12 +118,15 @@ class MonitorState:
         if width == current_width:
             return False
 
-        for timeline in self.timelines.values():
+        for host_id, timeline in self.timelines.items():
             timeline.symbols = deque(timeline.symbols, maxlen=width)
             timeline.sequence_history = deque(timeline.sequence_history, maxlen=width)
             timeline.rtt_history = deque(timeline.rtt_history, maxlen=width)
             timeline.time_history = deque(timeline.time_history, maxlen=width)
             timeline.ttl_history = deque(timeline.ttl_history, maxlen=width)
+            timeline.streak_runs = deque(timeline.streak_runs, maxlen=width)
+            self._refresh_streak(host_id, len(timeline.symbols))
+            self._recompute_jitter(host_id)
             # Rebuild pending indices because shrinking shifts element positions.
             pending: Dict[int, int] = {}
             for index, (symbol, sequence) in enumerate(zip(timeline.symbols, timeline.sequence_history)):
@@ -122,6 +135,98 @@ class MonitorState:
             timeline.pending_by_sequence = pending
         return True
 
+    def _refresh_streak(self, host_id: int, start_index: int) -> None:
+        """
+        Recompute run lengths from ``start_index`` onward and update the host's current streak.
+
+        Results only ever replace pending slots near the tail, so this touches
+        at most a few slots per event instead of rescanning the whole timeline.
+        """
+        timeline = self.timelines[host_id]
+        symbols = timeline.symbols
+        runs = timeline.streak_runs
+        for index in range(start_index, len(symbols)):
+            kind = self._streak_kinds.get(symbols[index])
+            run = 0
+            if kind is not None:
+                run = 1
+                if index > 0 and self._streak_kinds.get(symbols[index - 1]) == kind:
+                    run += runs[index - 1]
+            runs[index] = run
+
+        stats = self.stats[host_id]
+        kind = self._streak_kinds.get(symbols[-1]) if symbols else None
+        stats.streak_type = kind
+        # Runs may extend past slots that already fell off the bounded deque.
+        stats.streak_length = min(runs[-1], len(symbols)) if kind is not None else 0
+
+    def _recompute_jitter(self, host_id: int) -> None:
+        """Rebuild the host's jitter sums from its whole RTT window."""
+        stats = self.stats[host_id]
+        stats.jitter_sum = 0.0
+        stats.jitter_pairs = 0
+        previous = None
+        for value in self.timelines[host_id].rtt_history:
+            if value is None:
+                continue
+            if previous is not None:
+                stats.jitter_sum += abs(value - previous)
+                stats.jitter_pairs += 1
+            previous = value
+
+    @staticmethod
+    def _rtt_neighbors(rtts: Deque[Optional[float]], index: int) -> Tuple[Optional[float], Optional[float]]:
+        """Return the nearest replies before and after ``index`` (None when absent)."""
+        before = None
+        for position in range(index - 1, -1, -1):
+            if rtts[position] is not None:
+                before = rtts[position]
+                break
+        after = None
+        for position in range(index + 1, len(rtts)):
+            if rtts[position] is not None:
+                after = rtts[position]
+                break
+        return before, after
+
+    def _adjust_jitter(self, host_id: int, index: int, value: Optional[float], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) the pairs formed by a reply at ``index``."""
+        if value is None:
+            return
+        before, after = self._rtt_neighbors(self.timelines[host_id].rtt_history, index)
+        stats = self.stats[host_id]
+        delta = 0.0
+        pairs = 0
+        if before is not None:
+            delta += abs(value - before)
+            pairs += 1
+        if after is not None:
+            delta += abs(after - value)
+            pairs += 1
+        if before is not None and after is not None:
+            # The reply sits between two others that would otherwise pair directly.
+            delta -= abs(after - before)
+            pairs -= 1
+        stats.jitter_sum += sign * delta
+        stats.jitter_pairs += sign * pairs
+        if stats.jitter_pairs == 0:
+            stats.jitter_sum = 0.0
+
+    def _append_rtt(self, host_id: int, value: Optional[float]) -> None:
+        """Append an RTT slot, keeping jitter sums in step with the bounded window."""
+        rtts = self.timelines[host_id].rtt_history
+        if rtts.maxlen is not None and len(rtts) == rtts.maxlen:
+            self._adjust_jitter(host_id, 0, rtts[0], -1)
+        rtts.append(value)
+        self._adjust_jitter(host_id, len(rtts) - 1, value, 1)
+
+    def _replace_rtt(self, host_id: int, index: int, value: Optional[float]) -> None:
+        """Replace an RTT slot in place, keeping jitter sums in step."""
+        rtts = self.timelines[host_id].rtt_history
+        self._adjust_jitter(host_id, index, rtts[index], -1)
+        rtts[index] = value
+        self._adjust_jitter(host_id, index, value, 1)
+
     def apply_event(self, event: PingEvent) -> None:
         """Apply one ping event to timeline and aggregate stats."""
         timeline = self.timelines[event.host_id]
@@ -129,25 +234,30 @@ class MonitorState:
         if event.status == "sent":
             timeline.symbols.append(self._symbols["sent"])
             timeline.sequence_history.append(event.sequence)
-            timeline.rtt_history.append(None)
+            self._append_rtt(event.host_id, None)
             timeline.time_history.append(event.sent_time)
             timeline.ttl_history.append(None)
+            timeline.streak_runs.append(0)
             timeline.pending_by_sequence[event.sequence] = len(timeline.symbols) - 1
+            self._refresh_streak(event.host_id, len(timeline.symbols) - 1)
             return
 
         pending_index = timeline.pending_by_sequence.pop(event.sequence, None)
         if pending_index is not None and pending_index < len(timeline.symbols):
             timeline.symbols[pending_index] = self._symbols[event.status]
             timeline.sequence_history[pending_index] = event.sequence
-            timeline.rtt_history[pending_index] = event.rtt_seconds
+            self._replace_rtt(event.host_id, pending_index, event.rtt_seconds)
             timeline.time_history[pending_index] = event.sent_time
             timeline.ttl_history[pending_index] = event.ttl
+            self._refresh_streak(event.host_id, pending_index)
         else:
             timeline.symbols.append(self._symbols[event.status])
             timeline.sequence_history.append(event.sequence)
-            timeline.rtt_history.append(event.rtt_seconds)
+            self._append_rtt(event.host_id, event.rtt_seconds)
             timeline.time_history.append(event.sent_time)
             timeline.ttl_history.append(event.ttl)
+            timeline.streak_runs.append(0)
+            self._refresh_streak(event.host_id, len(timeline.symbols) - 1)
 
         stats = self.stats[event.host_id]
         stats.total += 1
@@ -56,6 +56,11 @@ def sync_legacy_host_from_v2(
     host_stats["rtt_sum"] = stats.rtt_sum
     host_stats["rtt_sum_sq"] = stats.rtt_sum_sq
     host_stats["rtt_count"] = stats.rtt_count
+    host_stats["streak_type"] = stats.streak_type
+    host_stats["streak_length"] = stats.streak_length
+    host_stats["jitter_sum"] = stats.jitter_sum
+    host_stats["jitter_pairs"] = stats.jitter_pairs
+    host_stats["jitter_window"] = len(timeline.rtt_history)
 
 
 def project_legacy_state_from_v2(v2_state: Any, symbols: Dict[str, str]) -> Tuple[Dict[int, Any], Dict[int, Any]]:
@@ -79,6 +84,11 @@ def project_legacy_state_from_v2(v2_state: Any, symbols: Dict[str, str]) -> Tupl
             "rtt_sum": 0.0,
             "rtt_sum_sq": 0.0,
             "rtt_count": 0,
+            "streak_type": None,
+            "streak_length": 0,
+            "jitter_sum": 0.0,
+            "jitter_pairs": 0,
+            "jitter_window": 0,
         }
         sync_legacy_host_from_v2(v2_state, host_id, host_buffer, host_stats, symbols)
         buffers[host_id] = host_buffer
@@ -5,9 +5,24 @@ This implementation is API-compatible with ``paraping.sequence_tracker.SequenceT
 """
 
 import threading
+from array import array
 from typing import Dict, Optional, Set
 
 
+class _HostState:
+    """Sequence counter and in-flight sequence numbers for one host.
+
+    In-flight sequences are kept in a packed uint16 array: there are only a
+    handful per host, so membership scans are cheap and no boxed ints are held.
+    """
+
+    __slots__ = ("seq", "outstanding")
+
+    def __init__(self, seq: int = 0) -> None:
+        self.seq = seq
+        self.outstanding = array("H")
+
+
 class SequenceTracker:
     """
     Tracks ICMP sequence numbers and outstanding pings per host.
@@ -20,60 +35,59 @@ class SequenceTracker:
     def __init__(self, max_outstanding: int = 3) -> None:
         self.max_outstanding = max_outstanding
         self._lock = threading.Lock()
-        self._sequences: Dict[str, int] = {}
-        self._outstanding: Dict[str, Set[int]] = {}
+        self._state: Dict[str, _HostState] = {}
 
     def get_next_sequence(self, host: str) -> Optional[int]:
         with self._lock:
-            if host not in self._sequences:
-                self._sequences[host] = 0
-                self._outstanding[host] = set()
+            state = self._state.get(host)
+            if state is None:
+                state = self._state[host] = _HostState()
 
-            if len(self._outstanding[host]) >= self.max_outstanding:
+            if len(state.outstanding) >= self.max_outstanding:
                 return None
 
-            seq = self._sequences[host]
-            self._outstanding[host].add(seq)
-            self._sequences[host] = (seq + 1) % 65536
+            seq = state.seq
+            state.outstanding.append(seq)
+            state.seq = (seq + 1) & 0xFFFF
             return seq
 
     def mark_replied(self, host: str, sequence: int) -> bool:
         with self._lock:
-            if host not in self._outstanding:
+            state = self._state.get(host)
+            if state is None:
                 return False
 
-            if sequence in self._outstanding[host]:
-                self._outstanding[host].remove(sequence)
+            if sequence in state.outstanding:
+                state.outstanding.remove(sequence)
                 return True
 
             return False
 
     def get_outstanding_count(self, host: str) -> int:
         with self._lock:
-            if host not in self._outstanding:
+            state = self._state.get(host)
+            if state is None:
                 return 0
-            return len(self._outstanding[host])
+            return len(state.outstanding)
 
     def get_outstanding_sequences(self, host: str) -> Set[int]:
         with self._lock:
-            if host not in self._outstanding:
+            state = self._state.get(host)
+            if state is None:
                 return set()
-            return self._outstanding[host].copy()
+            return set(state.outstanding)
 
     def reset_host(self, host: str) -> None:
         with self._lock:
-            if host in self._sequences:
-                del self._sequences[host]
-            if host in self._outstanding:
-                del self._outstanding[host]
+            self._state.pop(host, None)
 
     def reset_all(self) -> None:
         with self._lock:
-            self._sequences.clear()
-            self._outstanding.clear()
+            self._state.clear()
 
     def can_send_ping(self, host: str) -> bool:
         with self._lock:
-            if host not in self._outstanding:
+            state = self._state.get(host)
+            if state is None:
                 return True
-            return len(self._outstanding[host]) < self.max_outstanding
+            return len(state.outstanding) < self.max_outstanding
@@ -25,6 +25,7 @@ import os
 import sys
 import threading
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path to import paraping
@@ -33,12 +34,17 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from paraping.cli import (
     _apply_manual_reload,
     _check_terminal_resize_and_request_redraw,
+    _compute_runtime_timeline_width,
     _configure_logging,
     _handle_user_input,
+    _render_frame,
     _setup_hosts_and_state,
     handle_options,
     main,
 )
+from paraping.ui_render import ACTIVITY_INDICATOR_SPEED_HZ, build_display_lines
+from paraping_v2.engine import MonitorState
+from paraping_v2.legacy_adapter import project_legacy_state_from_v2
 
 
 class TestCLIArgumentParsing(unittest.TestCase):
@@ -865,6 +871,165 @@ class TestCLITerminalResizeCheck(unittest.TestCase):
         self.assertTrue(state["updated"])
 
 
+class TestCLIRenderFrame(unittest.TestCase):
+    """Test frame scheduling in the main loop."""
+
+    def _make_state(self) -> dict:
+        return {
+            "force_render": False,
+            "updated": False,
+            "paused": False,
+            "kitt_mode_enabled": False,
+            "refresh_interval": 0.10,
+            "last_render": 0.0,
+            "last_frame_clock": None,
+            "next_frame_clock_time": 0.0,
+            "display_tz": None,
+            "render_snapshot_timestamp": None,
+            "host_infos": [],
+            "render_buffers": {},
+            "render_stats": {},
+            "symbols": {},
+            "panel_position": "right",
+            "modes": ["alias"],
+            "mode_index": 0,
+            "sort_modes": ["config"],
+            "sort_mode_index": 0,
+            "filter_modes": ["all"],
+            "filter_mode_index": 0,
+            "display_modes": ["timeline"],
+            "display_mode_index": 0,
+            "summary_modes": ["rates"],
+            "summary_mode_index": 0,
+            "summary_scope_modes": ["host"],
+            "summary_scope_mode_index": 0,
+            "group_by_modes": ["none"],
+            "group_by_mode_index": 0,
+            "kitt_style_modes": ["scanner"],
+            "kitt_style_index": 0,
+            "pulse_position": "none",
+            "show_asn": False,
+            "show_help": False,
+            "host_select_active": False,
+            "graph_host_id": None,
+            "host_scroll_offset": 0,
+            "render_paused": False,
+            "status_message": None,
+            "use_color": False,
+            "summary_fullscreen": False,
+            "interval_seconds": 1.0,
+            "dormant": False,
+        }
+
+    @patch("paraping.cli.render_display")
+    @patch("paraping.cli.get_terminal_size", return_value=os.terminal_size((80, 24)))
+    @patch("paraping.cli.compute_host_scroll_bounds", return_value=(0, 0, 0))
+    @patch("paraping.cli.activity_indicator_tick", return_value=7)
+    @patch("paraping.cli.format_timestamp", return_value="2025-01-01 00:00:00 (UTC)")
+    def test_periodic_refresh_skips_unchanged_frame(self, _mock_ts, mock_tick, _mock_bounds, _mock_size, mock_render):
+        """Periodic refreshes should only redraw when the clock or activity indicator moves."""
+        args = argparse.Namespace(slow_threshold=0.5)
+        state = self._make_state()
+
+        with patch("paraping.cli.time.time", return_value=1.0):
+            _render_frame(args, state)
+        self.assertEqual(mock_render.call_count, 1)
+
+        with patch("paraping.cli.time.time", return_value=1.2):
+            _render_frame(args, state)
+        self.assertEqual(mock_render.call_count, 1)
+        self.assertEqual(state["last_render"], 1.2)
+
+        state["updated"] = True
+        with patch("paraping.cli.time.time", return_value=1.25):
+            _render_frame(args, state)
+        self.assertEqual(mock_render.call_count, 2)
+
+        mock_tick.return_value = 8
+        with patch("paraping.cli.time.time", return_value=1.4):
+            _render_frame(args, state)
+        self.assertEqual(mock_render.call_count, 3)
+
+        state["kitt_mode_enabled"] = True
+        with patch("paraping.cli.time.time", return_value=1.5):
+            _render_frame(args, state)
+        self.assertEqual(mock_render.call_count, 4)
+
+    @patch("paraping.cli.render_display")
+    @patch("paraping.cli.get_terminal_size", return_value=os.terminal_size((80, 24)))
+    @patch("paraping.cli.compute_host_scroll_bounds", return_value=(0, 0, 0))
+    @patch("paraping.cli.activity_indicator_tick")
+    @patch("paraping.cli.format_timestamp", return_value="2025-01-01 00:00:00 (UTC)")
+    def test_periodic_refresh_waits_for_next_indicator_tick(self, mock_ts, mock_tick, _mock_bounds, _mock_size, mock_render):
+        """Periodic refreshes should wake on indicator tick boundaries, not mid-tick."""
+        args = argparse.Namespace(slow_threshold=0.5)
+        state = self._make_state()
+        clock = {"now": 1.0}
+        mock_tick.side_effect = lambda _now_utc: int(clock["now"] * ACTIVITY_INDICATOR_SPEED_HZ)
+
+        with patch("paraping.cli.time.time", side_effect=lambda: clock["now"]):
+            _render_frame(args, state)
+            self.assertEqual(state["next_frame_clock_time"], 1.0 + 1 / ACTIVITY_INDICATOR_SPEED_HZ)
+
+            # Past the refresh interval but still inside the same tick: nothing is evaluated.
+            mock_ts.reset_mock()
+            clock["now"] = 1.11
+            _render_frame(args, state)
+            mock_ts.assert_not_called()
+            self.assertEqual(mock_render.call_count, 1)
+
+            # Every periodic wake-up lands on a new tick, so each one redraws.
+            for now in (1.125, 1.25, 1.375):
+                clock["now"] = now
+                _render_frame(args, state)
+        self.assertEqual(mock_render.call_count, 4)
+
+
+class TestCLITimelineWidth(unittest.TestCase):
+    """Test buffer width sizing against the rendered layout."""
+
+    def test_runtime_width_matches_rendered_timeline(self):
+        """Buffers sized at the runtime width should be rendered without re-wrapping."""
+        symbols = {"success": ".", "fail": "x", "slow": "!", "pending": "-"}
+        host_infos = [
+            {"id": i, "alias": f"host{i}", "host": f"host{i}", "ip": "10.0.0.1", "rdns": None, "asn": None} for i in range(3)
+        ]
+        term_size = os.terminal_size((120, 40))
+        for panel_position in ("right", "bottom"):
+            state = {
+                "panel_position": panel_position,
+                "pulse_position": "none",
+                "modes": ["alias"],
+                "mode_index": 0,
+                "show_asn": False,
+                "host_infos": host_infos,
+            }
+            width = _compute_runtime_timeline_width(state, term_size)
+            buffers, stats = project_legacy_state_from_v2(MonitorState([0, 1, 2], timeline_width=width), symbols)
+            timeline = buffers[0]["timeline"]
+            with patch("paraping.ui_render.get_terminal_size", return_value=term_size):
+                build_display_lines(
+                    host_infos,
+                    buffers,
+                    stats,
+                    symbols,
+                    panel_position,
+                    "alias",
+                    "timeline",
+                    "rates",
+                    "config",
+                    "all",
+                    0.5,
+                    False,
+                    False,
+                    False,
+                    None,
+                    "ts",
+                    datetime.now(timezone.utc),
+                )
+            self.assertIs(buffers[0]["timeline"], timeline)
+
+
 class TestCLIIntervalHotkeys(unittest.TestCase):
     """Test runtime interval updates driven by hotkeys."""
 
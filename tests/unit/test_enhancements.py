@@ -176,6 +176,12 @@ class TestMonochromeSquareVisualization(unittest.TestCase):
         # Should be: square, blank, square, dash
         self.assertEqual(result, "■ ■-")
 
+    def test_monochrome_unknown_symbol_is_dash(self):
+        """Test that symbols outside the symbol set render as pending in monochrome mode"""
+        result = build_colored_square_timeline([".", "?", "x"], self.symbols, use_color=False)
+
+        self.assertEqual(result, "■- ")
+
     def test_color_mode_uses_colors(self):
         """Test that color mode still uses ANSI colors"""
         timeline = [".", "x", "!"]
@@ -186,6 +192,13 @@ class TestMonochromeSquareVisualization(unittest.TestCase):
         # Should still use square symbols
         self.assertIn("■", result)
 
+    def test_color_mode_coalesces_runs(self):
+        """Test that adjacent squares of the same color share one color span"""
+        timeline = [".", "!", "x", "x", "-"]
+        result = build_colored_square_timeline(timeline, self.symbols, use_color=True)
+
+        self.assertEqual(result, "\x1b[32m■■\x1b[0m\x1b[31m■■\x1b[0m\x1b[37m■\x1b[0m")
+
 
 if __name__ == "__main__":
     unittest.main()
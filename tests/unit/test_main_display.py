@@ -523,6 +523,25 @@ class TestTimezoneFormatting(unittest.TestCase):
         label = format_timezone_label(now_utc, timezone.utc)
         self.assertEqual(label, "UTC")
 
+    def test_format_timezone_label_uses_local_wall_time(self):
+        """Test the zone label follows the display zone's local time, not UTC wall time"""
+        new_york = ZoneInfo("America/New_York")
+        # 03:00 UTC is 22:00 EST on the previous evening, hours before the DST switch.
+        self.assertEqual(format_timezone_label(datetime(2025, 3, 9, 3, 0, 0, tzinfo=timezone.utc), new_york), "EST")
+        self.assertEqual(format_timezone_label(datetime(2025, 3, 9, 7, 0, 0, tzinfo=timezone.utc), new_york), "EDT")
+
+    def test_format_timestamp_reuses_label_within_minute(self):
+        """Test the timezone label is resolved once per minute and follows DST changes"""
+        new_york = ZoneInfo("America/New_York")
+        # New York springs forward at 2025-03-09 07:00 UTC (02:00 EST -> 03:00 EDT).
+        before = datetime(2025, 3, 9, 6, 59, 30, tzinfo=timezone.utc)
+        after = datetime(2025, 3, 9, 7, 0, 0, tzinfo=timezone.utc)
+        self.assertTrue(format_timestamp(before, new_york).endswith("(EST)"))
+        with patch("paraping.ui_render.format_timezone_label") as mock_label:
+            self.assertTrue(format_timestamp(before.replace(second=45), new_york).endswith("(EST)"))
+        mock_label.assert_not_called()
+        self.assertTrue(format_timestamp(after, new_york).endswith("(EDT)"))
+
 
 class TestHostInfoBuilding(unittest.TestCase):
     """Test host info building functions"""
@@ -650,6 +669,12 @@ class TestColorOutput(unittest.TestCase):
         self.assertIn("\x1b[33m", colored)
         self.assertIn("\x1b[31m", colored)
 
+    def test_build_colored_sparkline_coalesces_runs(self):
+        """Adjacent bars with the same status should share one color span"""
+        symbols = {"success": ".", "fail": "x", "slow": "!"}
+        colored = build_colored_sparkline("▁▂▃▄", [".", ".", "x", "x"], symbols, use_color=True)
+        self.assertEqual(colored, "\x1b[37m▁▂\x1b[0m\x1b[31m▃▄\x1b[0m")
+
 
 class TestStatusLine(unittest.TestCase):
     """Test status line building function"""
@@ -688,6 +713,13 @@ class TestStatusLine(unittest.TestCase):
         result = build_status_line("latency", "failures", "rates", False, None, summary_all=True)
         self.assertIn("Summary: All", result)
 
+    def test_build_status_line_message_varies_with_cached_modes(self):
+        """Test status messages are appended fresh while the mode prefix is reused"""
+        first = build_status_line("host", "all", "rates", False, "Hosts: 1")
+        second = build_status_line("host", "all", "rates", False, "Hosts: 2")
+        self.assertEqual(first, "Sort: Host Name | Filter: All Items | Summary: Rates | Hosts: 1")
+        self.assertEqual(second, "Sort: Host Name | Filter: All Items | Summary: Rates | Hosts: 2")
+
 
 class TestStatusMetrics(unittest.TestCase):
     """Test status metrics computation."""
@@ -718,6 +750,16 @@ class TestStatusMetrics(unittest.TestCase):
             result = build_status_metrics(host_infos, stats, interval_seconds=1.0)
         self.assertIn("Rate: 12.5/s", result)
 
+    def test_build_status_metrics_skips_hosts_without_stats(self):
+        """Hosts without a stats entry should count as hosts but add no pings."""
+        host_infos = [{"id": 1}, {"id": 2}]
+        stats = {1: {"success": 3, "fail": 1}}
+        with patch.dict(os.environ, {"PARAPING_PING_RATE": ""}, clear=False):
+            result = build_status_metrics(host_infos, stats, interval_seconds=1.0)
+        self.assertIn("Hosts: 2", result)
+        self.assertIn("Success: 3", result)
+        self.assertIn("Errors: 1", result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,7 @@ Unit tests for layout computation and terminal size handling
 """
 
 import os
+import signal
 import sys
 import unittest
 from collections import deque
@@ -25,6 +26,7 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from main import build_display_lines, compute_main_layout, compute_panel_sizes, get_terminal_size  # noqa: E402
+from paraping.ui_render import disable_terminal_size_cache, enable_terminal_size_cache  # noqa: E402
 
 
 class TestLayoutComputation(unittest.TestCase):
@@ -226,6 +228,32 @@ class TestTerminalSize(unittest.TestCase):
             else:
                 os.environ.pop("LINES", None)
 
+    @unittest.skipUnless(hasattr(signal, "SIGWINCH"), "SIGWINCH is not available on this platform")
+    @patch("paraping.cli.os.get_terminal_size")
+    @patch("paraping.cli.sys.stdout")
+    def test_get_terminal_size_cached_until_sigwinch(self, mock_stdout, mock_os_get_size):
+        """Cached size should be reused until SIGWINCH marks it stale"""
+        mock_stdout.isatty.return_value = True
+        mock_stdout.fileno.return_value = 1
+        mock_os_get_size.return_value = os.terminal_size((100, 50))
+
+        previous_handler = enable_terminal_size_cache()
+        try:
+            self.assertEqual(get_terminal_size().columns, 100)
+            self.assertEqual(get_terminal_size().columns, 100)
+            self.assertEqual(mock_os_get_size.call_count, 1)
+
+            mock_os_get_size.return_value = os.terminal_size((120, 40))
+            signal.raise_signal(signal.SIGWINCH)
+            self.assertEqual(get_terminal_size().columns, 120)
+            self.assertEqual(mock_os_get_size.call_count, 2)
+        finally:
+            disable_terminal_size_cache(previous_handler)
+
+        get_terminal_size()
+        get_terminal_size()
+        self.assertEqual(mock_os_get_size.call_count, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
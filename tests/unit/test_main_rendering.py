@@ -20,7 +20,7 @@ import sys
 import unittest
 from collections import deque
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Add parent directory to path to import main
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -35,8 +35,12 @@ from main import (  # noqa: E402
 )
 from paraping.stats import resolve_site_tag1_labels  # noqa: E402
 from paraping.ui_render import (  # noqa: E402
+    ANSI_RESET,
+    STATUS_COLORS,
+    _compose_row,
     _resolve_kitt_gradient_rings,
     _resolve_kitt_scanner_speed_hz,
+    _row_label_prefix,
     build_colored_sparkline,
     build_colored_timeline,
     build_display_entries,
@@ -49,8 +53,10 @@ from paraping.ui_render import (  # noqa: E402
     can_render_full_summary,
     colorize_text,
     compute_activity_indicator_width,
+    compute_host_scroll_bounds,
     compute_main_layout,
     compute_panel_sizes,
+    compute_summary_data,
     cycle_panel_position,
     format_display_name,
     format_status_line,
@@ -58,8 +64,10 @@ from paraping.ui_render import (  # noqa: E402
     format_timestamp,
     format_timezone_label,
     latest_status_from_timeline,
+    mark_display_names_dirty,
     pad_lines,
     pad_visible,
+    precompute_summary_suffixes,
     render_display,
     render_fullscreen_rtt_graph,
     render_kitt_bottom_band,
@@ -110,6 +118,12 @@ class TestHelpView(unittest.TestCase):
         combined = "\n".join(lines)
         self.assertIn("q: quit", combined)
 
+    def test_help_view_returns_fresh_list_per_call(self):
+        """Cached help layouts should not leak caller mutations into later frames."""
+        lines = render_help_view(100, 40)
+        lines[0] = "mutated"
+        self.assertNotEqual(render_help_view(100, 40)[0], "mutated")
+
 
 class TestBoxedRendering(unittest.TestCase):
     """Test boxed panel rendering helpers."""
@@ -126,6 +140,11 @@ class TestBoxedRendering(unittest.TestCase):
             ],
         )
 
+    def test_box_lines_pads_and_truncates_rows(self):
+        """Ensure box_lines fills missing rows and drops rows beyond the inner height."""
+        self.assertEqual(box_lines(["ab"], width=4, height=4), ["+--+", "|ab|", "|  |", "+--+"])
+        self.assertEqual(box_lines(["a", "b", "c"], width=3, height=4), ["+-+", "|a|", "|b|", "+-+"])
+
     def test_render_status_box_wraps_status_line(self):
         """Ensure status lines are boxed to the requested width."""
         boxed = render_status_box("Status", width=10)
@@ -149,6 +168,18 @@ class TestAsciiGraph(unittest.TestCase):
         lines = build_ascii_graph([1.0, 2.0], width=2, height=3, style="bar")
         self.assertEqual(lines[-1][1], "#")
 
+    def test_build_ascii_graph_exact_grid(self):
+        """Line and bar styles should place marks by scaled value, left-padding short input."""
+        values = [0.0, 1.0, None, 2.0]
+        self.assertEqual(
+            build_ascii_graph(values, width=5, height=3, style="line"),
+            ["    *", "  *  ", "x* x "],
+        )
+        self.assertEqual(
+            build_ascii_graph(values, width=5, height=3, style="bar"),
+            ["    #", "  # #", "x##x#"],
+        )
+
     def test_render_host_selection_view_highlight(self):
         """Selection view should highlight the selected host."""
         entries = [(0, "host1"), (1, "host2")]
@@ -757,6 +788,14 @@ class TestColorAndNonTTY(unittest.TestCase):
         result, _ = truncate_visible(colored, 3)
         self.assertTrue(result.endswith("\x1b[0m"))
 
+    def test_truncate_visible_spans_multiple_escape_chunks(self):
+        """truncate_visible must budget visible chars across escape boundaries."""
+        colored = "\x1b[31mab\x1b[0m\x1b[33mcd\x1b[0m"
+        self.assertEqual(truncate_visible(colored, 3), ("\x1b[31mab\x1b[0m\x1b[33mc\x1b[0m", 3))
+        self.assertEqual(truncate_visible(colored, 10), (colored, 4))
+        self.assertEqual(truncate_visible(colored, 0), ("", 0))
+        self.assertEqual(truncate_visible("a\x1bb", 2), ("a\x1b", 2))
+
     def test_build_colored_timeline_no_color(self):
         """build_colored_timeline with use_color=False should have no ANSI."""
         result = build_colored_timeline([".", "x"], _SYMBOLS, use_color=False)
@@ -767,6 +806,19 @@ class TestColorAndNonTTY(unittest.TestCase):
         result = build_colored_timeline([".", "x"], _SYMBOLS, use_color=True)
         self.assertIn("\x1b[", result)
 
+    def test_build_colored_timeline_coalesces_runs(self):
+        """build_colored_timeline should emit one color span per run and pass unknowns through."""
+        timeline = [".", ".", "!", "x", "x", "x", "-", "?"]
+        expected = (
+            colorize_text("..", "success", True)
+            + colorize_text("!", "slow", True)
+            + colorize_text("xxx", "fail", True)
+            + colorize_text("-", "pending", True)
+            + "?"
+        )
+        self.assertEqual(build_colored_timeline(timeline, _SYMBOLS, use_color=True), expected)
+        self.assertEqual(build_colored_timeline(timeline, _SYMBOLS, use_color=False), "..!xxx-?")
+
     def test_build_colored_sparkline_no_color(self):
         """build_colored_sparkline with use_color=False returns plain sparkline."""
         sparkline = "▁▂▃"
@@ -876,6 +928,12 @@ class TestAnsiEdgeCases(unittest.TestCase):
         text = "\x1b[31m\x1b[1mhello\x1b[0m\x1b[0m"
         self.assertEqual(visible_len(text), 5)
 
+    def test_pad_visible_plain_text(self):
+        """pad_visible should truncate or pad plain text without ANSI handling."""
+        self.assertEqual(pad_visible("hello", 8), "hello   ")
+        self.assertEqual(pad_visible("hello world", 5), "hello")
+        self.assertEqual(pad_visible("hello", 0), "")
+
     def test_pad_visible_with_ansi(self):
         """pad_visible should pad based on visible width, not raw string length."""
         colored = "\x1b[32mhi\x1b[0m"
@@ -888,6 +946,12 @@ class TestAnsiEdgeCases(unittest.TestCase):
         result = rjust_visible(colored, 10)
         self.assertEqual(visible_len(result), 10)
 
+    def test_compose_row_matches_rjust_visible(self):
+        """Composing by a known visible width should match the ANSI-scanning variant."""
+        colored = "\x1b[32mhi\x1b[0m"
+        self.assertEqual(_compose_row("host | ", colored, 2, 10), "host | " + rjust_visible(colored, 10))
+        self.assertEqual(_compose_row("host | ", colored, 2, 1), "host | " + colored)
+
     def test_truncate_visible_plain_text(self):
         """truncate_visible should work with plain text."""
         result, count = truncate_visible("hello world", 5)
@@ -1075,6 +1139,10 @@ class TestDisplayFormatting(unittest.TestCase):
         info = self._make_host_info(rdns="hostname.example.com")
         self.assertEqual(resolve_display_name(info, "rdns"), "hostname.example.com")
 
+    def test_resolve_display_name_unknown_mode_uses_ip(self):
+        info = self._make_host_info(ip="10.0.0.9", alias="myhost")
+        self.assertEqual(resolve_display_name(info, "bogus"), "10.0.0.9")
+
     def test_format_status_line(self):
         """format_status_line should format host and timeline with separator."""
         result = format_status_line("host1", "...xxx", label_width=10)
@@ -1082,6 +1150,20 @@ class TestDisplayFormatting(unittest.TestCase):
         self.assertIn("|", result)
         self.assertIn("...xxx", result)
 
+    def test_row_label_prefix_matches_format_status_line(self):
+        """Cached row prefixes should equal the colored, padded status line start."""
+        for status, use_color in (("fail", True), ("success", False), (None, True)):
+            expected = format_status_line(colorize_text("host1", status, use_color), "...xxx", 8)
+            self.assertEqual(_row_label_prefix("host1", status, use_color, 8) + "...xxx", expected)
+
+    def test_colored_timeline_follows_symbol_content(self):
+        """Cached symbol tables should be keyed by the symbols, not the dict object."""
+        symbols = {"success": ".", "fail": "x", "slow": "!", "pending": "-"}
+        self.assertEqual(build_colored_timeline(["x"], symbols, True), f"{STATUS_COLORS['fail']}x{ANSI_RESET}")
+        symbols["fail"] = "#"
+        self.assertEqual(build_colored_timeline(["x"], symbols, True), "x")
+        self.assertEqual(build_colored_timeline(["#"], symbols, True), f"{STATUS_COLORS['fail']}#{ANSI_RESET}")
+
     def test_build_time_axis_basic(self):
         """build_time_axis should return a string with label padding."""
         axis = build_time_axis(timeline_width=20, label_width=10)
@@ -1162,6 +1244,14 @@ class TestFullscreenRttGraph(unittest.TestCase):
         combined = "\n".join(lines)
         self.assertIn("n/a", combined)
 
+    def test_render_fullscreen_rtt_y_ticks(self):
+        """Y-axis ticks should label the top, middle, and bottom graph rows only."""
+        lines = render_fullscreen_rtt_graph(
+            "host1", [0.01, 0.03], [1.0, 2.0], width=40, height=10, display_mode="line", paused=False, timestamp="ts"
+        )
+        axis = [line.split(" | ", 1)[0] for line in lines[3:8]]
+        self.assertEqual(axis, ["30.0", "    ", "20.0", "    ", "10.0"])
+
     def test_render_fullscreen_rtt_zero_size_returns_empty(self):
         """Fullscreen RTT graph with zero dimensions returns empty list."""
         lines = render_fullscreen_rtt_graph(
@@ -1924,6 +2014,19 @@ class TestIncrementalRendering(unittest.TestCase):
         self.assertIn("\x1b[4;1H\x1b[2K", output)
         self.assertNotIn("\x1b[4;2H", output)
 
+    def test_render_display_positions_every_row_absolutely(self):
+        """Each drawn row should start with its own cursor position so wide rows cannot shift later rows."""
+        stdout = io.StringIO()
+        args = ([], {}, {}, _SYMBOLS, "none", "alias", "timeline", "rates", "config", "all", 200.0)
+        args += (False, False, False, None, timezone.utc, False)
+        with patch("sys.stdout", new=stdout):
+            render_display(*args, override_lines=["one", "two", "three", "four"])
+            self.assertEqual(stdout.getvalue(), "\x1b[2J\x1b[1;1Hone\x1b[2;1Htwo\x1b[3;1Hthree\x1b[4;1Hfour")
+            stdout.seek(0)
+            stdout.truncate(0)
+            render_display(*args, override_lines=["one", "", "", "4"])
+        self.assertEqual(stdout.getvalue(), "\x1b[2;1H\x1b[2K\x1b[3;1H\x1b[2K\x1b[4;1H4\x1b[K")
+
 
 class TestBuildDisplayEntries(unittest.TestCase):
     """Test build_display_entries sorting and filtering."""
@@ -1960,6 +2063,18 @@ class TestBuildDisplayEntries(unittest.TestCase):
         labels = [e[1] for e in entries]
         self.assertEqual(labels, sorted(labels))
 
+    def test_sort_by_streak_uses_maintained_streak_fields(self):
+        """build_display_entries should rank by engine-maintained fail streaks when present."""
+        infos = self._make_host_infos(3)
+        buffers = _make_buffers([0, 1, 2], timeline_data=["x"] * 5, rtt_data=[None] * 5)
+        names = {0: "h2", 1: "h1", 2: "h0"}
+        stats = self._make_stats()
+        stats[0].update({"streak_type": "fail", "streak_length": 1})
+        stats[1].update({"streak_type": "success", "streak_length": 4})
+        stats[2].update({"streak_type": "fail", "streak_length": 3})
+        entries = build_display_entries(infos, names, buffers, stats, _SYMBOLS, "streak", "all", 200.0)
+        self.assertEqual([host_id for host_id, _ in entries], [2, 0, 1])
+
     def test_sort_by_failures(self):
         """build_display_entries with sort_mode=failures should sort by fail count."""
         infos = self._make_host_infos(3)
@@ -2230,6 +2345,14 @@ class TestShouldShowAsn(unittest.TestCase):
         """should_show_asn returns False for empty host list."""
         self.assertFalse(should_show_asn([], "ip", show_asn=True, term_width=120))
 
+    def test_show_asn_width_matches_formatted_labels(self):
+        """should_show_asn should budget the widest padded label, including [REMOVED]."""
+        infos = [self._host_info(alias="a" * 10), dict(self._host_info(alias="b"), id=1, removed=True)]
+        label_width = max(len(name) for name in build_display_names(infos, "alias", True, 8).values())
+        self.assertEqual(label_width, 10 + 1 + 8 + len(" [REMOVED]"))
+        self.assertTrue(should_show_asn(infos, "alias", show_asn=True, term_width=label_width + 13))
+        self.assertFalse(should_show_asn(infos, "alias", show_asn=True, term_width=label_width + 12))
+
 
 class TestBuildDisplayNames(unittest.TestCase):
     """Test build_display_names and format_display_name."""
@@ -2259,6 +2382,57 @@ class TestBuildDisplayNames(unittest.TestCase):
         names = build_display_names(infos, "alias", include_asn=True, asn_width=8)
         self.assertIn("AS1234", names[0])
 
+    def test_build_display_names_refreshes_changed_hosts(self):
+        """Cached names must follow ASN updates and alignment changes from other hosts."""
+        infos = [self._host_info(0, "host1", None), self._host_info(1, "h2", None)]
+        self.assertEqual(build_display_names(infos, "alias", True, 6), {0: "host1       ", 1: "h2          "})
+
+        infos[0]["asn"] = "AS1234"
+        mark_display_names_dirty()
+        self.assertEqual(build_display_names(infos, "alias", True, 6)[0], "host1 AS1234")
+
+        infos[1]["alias"] = "longer-host"
+        mark_display_names_dirty()
+        names = build_display_names(infos, "alias", True, 6)
+        self.assertEqual(names, {0: "host1       AS1234", 1: "longer-host       "})
+
+    def test_build_display_names_reuses_result_until_marked_dirty(self):
+        """Unchanged host lists should return the previous names without re-resolving."""
+        infos = [self._host_info(0, "host1", None)]
+        names = build_display_names(infos, "alias", False, 6)
+        mock_resolve = MagicMock(return_value="unexpected")
+        with patch.dict("paraping.ui_render._DISPLAY_NAME_RESOLVERS", {"alias": mock_resolve}):
+            self.assertEqual(build_display_names(infos, "alias", False, 6), names)
+        mock_resolve.assert_not_called()
+        self.assertEqual(build_display_names(infos, "ip", False, 6), {0: "1.2.3.4"})
+        infos[0]["alias"] = "renamed"
+        mark_display_names_dirty()
+        self.assertEqual(build_display_names(infos, "alias", False, 6), {0: "renamed"})
+
+    def test_build_display_names_follows_rdns_and_removal_updates(self):
+        """rDNS results, removals, and purged host lists should all refresh reused names."""
+        infos = [self._host_info(0, "host1", None), self._host_info(1, "host2", None)]
+        self.assertEqual(build_display_names(infos, "rdns", False, 6), {0: "1.2.3.4", 1: "1.2.3.4"})
+
+        infos[0]["rdns"] = "host1.example.net"
+        mark_display_names_dirty()
+        self.assertEqual(build_display_names(infos, "rdns", False, 6)[0], "host1.example.net")
+
+        infos[1]["removed"] = True
+        mark_display_names_dirty()
+        self.assertEqual(build_display_names(infos, "rdns", False, 6)[1], "1.2.3.4 [REMOVED]")
+
+        # Purging retired hosts swaps in a new list, which needs no explicit invalidation.
+        self.assertEqual(build_display_names(infos[:1], "rdns", False, 6), {0: "host1.example.net"})
+
+    def test_build_display_names_returns_independent_dicts(self):
+        """Mutating a returned mapping must not leak into later calls."""
+        infos = [self._host_info(0, "host1", None)]
+        names = build_display_names(infos, "alias", False, 6)
+        names[0] = "changed"
+        names[99] = "extra"
+        self.assertEqual(build_display_names(infos, "alias", False, 6), {0: "host1"})
+
     def test_format_display_name_with_asn(self):
         """format_display_name includes ASN info when include_asn=True."""
         info = self._host_info(asn="AS9999")
@@ -2285,6 +2459,62 @@ class TestCanRenderFullSummary(unittest.TestCase):
         result = can_render_full_summary([entry], 5)
         self.assertFalse(result)
 
+    def test_precomputed_suffixes_match_entries(self):
+        """Precomputed suffixes drive both the width check and the formatted lines."""
+        entry = _make_summary_entry()
+        suffixes = precompute_summary_suffixes([entry])
+        width = len(suffixes[0]) + 1
+        self.assertTrue(can_render_full_summary([entry], width, suffixes))
+        self.assertFalse(can_render_full_summary([entry], width - 1, suffixes))
+        self.assertEqual(
+            format_summary_line(entry, 200, "rates", prefer_all=True, all_suffix=suffixes[0]),
+            format_summary_line(entry, 200, "rates", prefer_all=True),
+        )
+
+    def test_render_summary_view_reuses_precomputed_suffixes(self):
+        """render_summary_view should not rebuild suffixes that were passed in."""
+        entries = [_make_summary_entry(), _make_summary_entry()]
+        suffixes = precompute_summary_suffixes(entries)
+        expected = render_summary_view(entries, 200, 10, "rates", prefer_all=True)
+        with patch("paraping.ui_render.build_summary_all_suffix") as mock_suffix:
+            result = render_summary_view(entries, 200, 10, "rates", prefer_all=True, all_suffixes=suffixes)
+        mock_suffix.assert_not_called()
+        self.assertEqual(result, expected)
+
+    def test_render_summary_view_trusts_precomputed_fit(self):
+        """A precomputed full-summary fit should skip the width check entirely."""
+        entries = [_make_summary_entry()]
+        expected = render_summary_view(entries, 200, 10, "rates", prefer_all=True)
+        with patch("paraping.ui_render.can_render_full_summary") as mock_fit:
+            result = render_summary_view(entries, 200, 10, "rates", prefer_all=True, all_fits=True)
+        mock_fit.assert_not_called()
+        self.assertEqual(result, expected)
+
+
+class TestComputeHostScrollBounds(unittest.TestCase):
+    """Test compute_host_scroll_bounds."""
+
+    def _host_infos(self, n):
+        return [
+            {"id": i, "ip": f"10.0.0.{i}", "alias": f"host{i}", "host": f"host{i}", "rdns": None, "asn": None}
+            for i in range(n)
+        ]
+
+    @patch("paraping.ui_render.get_terminal_size", return_value=os.terminal_size((100, 12)))
+    def test_side_panel_skips_summary_rows(self, _mock_size):
+        """Only top/bottom summary panels should build summary rows for the bounds."""
+        host_infos = self._host_infos(20)
+        args = (host_infos, _make_buffers(list(range(20))), _make_stats(list(range(20))), _SYMBOLS)
+        with patch("paraping.ui_render.compute_summary_data", wraps=compute_summary_data) as mock_summary:
+            max_offset, visible_hosts, total_hosts = compute_host_scroll_bounds(
+                *args, "right", "alias", "host", "all", 0.5, False
+            )
+            mock_summary.assert_not_called()
+            self.assertEqual(total_hosts, 20)
+            self.assertEqual(max_offset, total_hosts - visible_hosts)
+            compute_host_scroll_bounds(*args, "bottom", "alias", "host", "all", 0.5, False)
+            mock_summary.assert_called_once()
+
 
 class TestBuildDisplayLines(unittest.TestCase):
     """Test build_display_lines with various configurations."""
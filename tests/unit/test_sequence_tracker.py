@@ -27,6 +27,7 @@ import unittest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from paraping.sequence_tracker import SequenceTracker  # noqa: E402  # pylint: disable=wrong-import-position
+from paraping_v2.sequence_tracker import _HostState  # noqa: E402  # pylint: disable=wrong-import-position
 
 
 class TestSequenceTracker(unittest.TestCase):
@@ -123,8 +124,7 @@ class TestSequenceTracker(unittest.TestCase):
         host = "192.0.2.1"
 
         # Set sequence counter to near wraparound
-        tracker._sequences[host] = 65534
-        tracker._outstanding[host] = set()
+        tracker._state[host] = _HostState(seq=65534)
 
         # Get sequences around wraparound point
         seq1 = tracker.get_next_sequence(host)
@@ -180,6 +180,22 @@ class TestSequenceTracker(unittest.TestCase):
         outstanding = tracker.get_outstanding_sequences(host)
         self.assertEqual(outstanding, {seq1, seq3})
 
+    def test_get_outstanding_sequences_returns_detached_set(self):
+        """Test that callers cannot mutate the tracker's in-flight sequences"""
+        tracker = SequenceTracker()
+        host = "192.0.2.1"
+        tracker._state[host] = _HostState(seq=65535)
+
+        self.assertEqual(tracker.get_next_sequence(host), 65535)
+        self.assertEqual(tracker.get_next_sequence(host), 0)
+
+        outstanding = tracker.get_outstanding_sequences(host)
+        outstanding.clear()
+        self.assertEqual(tracker.get_outstanding_sequences(host), {65535, 0})
+        self.assertFalse(tracker.mark_replied(host, 70000))
+        self.assertTrue(tracker.mark_replied(host, 65535))
+        self.assertEqual(tracker.get_outstanding_count(host), 1)
+
     def test_can_send_ping(self):
         """Test checking if a ping can be sent"""
         tracker = SequenceTracker(max_outstanding=3)
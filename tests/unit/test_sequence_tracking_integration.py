@@ -34,6 +34,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from paraping.pinger import scheduler_driven_ping_host  # noqa: E402  # pylint: disable=wrong-import-position
 from paraping.scheduler import Scheduler  # noqa: E402  # pylint: disable=wrong-import-position
 from paraping.sequence_tracker import SequenceTracker  # noqa: E402  # pylint: disable=wrong-import-position
+from paraping_v2.sequence_tracker import _HostState  # noqa: E402  # pylint: disable=wrong-import-position
 
 
 class TestSequenceTrackingIntegration(unittest.TestCase):
@@ -329,8 +330,7 @@ class TestSequenceTrackingIntegration(unittest.TestCase):
         host = "192.0.2.1"
 
         # Manually set the sequence counter to near wraparound
-        sequence_tracker._sequences[host] = 65534
-        sequence_tracker._outstanding[host] = set()
+        sequence_tracker._state[host] = _HostState(seq=65534)
 
         # Get sequences around wraparound
         seq1 = sequence_tracker.get_next_sequence(host)
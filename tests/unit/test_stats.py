@@ -16,11 +16,21 @@
 import os
 import sys
 import unittest
+from collections import deque
 
 # Add parent directory to path to import paraping
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from paraping.stats import is_hierarchical_group_by, natural_sort_key, resolve_group_labels
+from paraping.stats import (
+    build_summary_all_suffix,
+    build_summary_suffix,
+    compute_jitter,
+    is_hierarchical_group_by,
+    natural_sort_key,
+    resolve_group_labels,
+    resolve_jitter,
+    resolve_streak,
+)
 
 
 class TestNaturalSortKey(unittest.TestCase):
@@ -63,5 +73,87 @@ class TestResolveGroupLabels(unittest.TestCase):
         self.assertFalse(is_hierarchical_group_by("tag1"))
 
 
+class TestResolveStreak(unittest.TestCase):
+    """Test cases for streak resolution."""
+
+    SYMBOLS = {"success": ".", "fail": "x", "slow": "!", "pending": "-"}
+
+    def test_maintained_streak_is_used_and_capped_to_timeline(self) -> None:
+        """Engine-maintained streak fields should be read without rescanning."""
+        host_stats = {"streak_type": "fail", "streak_length": 9}
+        self.assertEqual(resolve_streak(deque(["x", "x", "x"]), host_stats, self.SYMBOLS), ("fail", 3))
+        host_stats = {"streak_type": None, "streak_length": 0}
+        self.assertEqual(resolve_streak(deque(["x", "-"]), host_stats, self.SYMBOLS), (None, 0))
+
+    def test_scan_fallback_without_maintained_fields(self) -> None:
+        """Stats without streak fields should fall back to a timeline scan."""
+        self.assertEqual(resolve_streak(deque(["x", ".", "!", "."]), {}, self.SYMBOLS), ("success", 3))
+        self.assertEqual(resolve_streak(deque([".", "x", "x"]), {}, self.SYMBOLS), ("fail", 2))
+        self.assertEqual(resolve_streak(deque([".", "-"]), {}, self.SYMBOLS), (None, 0))
+        self.assertEqual(resolve_streak(deque(), {}, self.SYMBOLS), (None, 0))
+
+
+class TestComputeJitter(unittest.TestCase):
+    """Test cases for jitter computation."""
+
+    def test_skips_missing_samples(self) -> None:
+        """Jitter should pair adjacent replies and ignore missing samples."""
+        jitter_ms, pairs = compute_jitter(deque([0.01, 0.02, None, 0.015]))
+        self.assertEqual(pairs, 2)
+        self.assertAlmostEqual(jitter_ms, 7.5)
+
+    def test_requires_two_samples(self) -> None:
+        """Fewer than two replies should report no jitter."""
+        self.assertEqual(compute_jitter(deque([None, 0.01, None])), (None, 0))
+        self.assertEqual(compute_jitter(deque()), (None, 0))
+
+    def test_resolve_jitter_uses_matching_running_sums(self) -> None:
+        """Maintained sums should be used only when they cover the same window."""
+        history = deque([0.01, 0.02, None, 0.015])
+        host_stats = {"jitter_sum": 0.5, "jitter_pairs": 2, "jitter_window": 4}
+        jitter_ms, pairs = resolve_jitter(history, host_stats)
+        self.assertEqual(pairs, 2)
+        self.assertAlmostEqual(jitter_ms, 250.0)
+
+        host_stats["jitter_window"] = 8
+        jitter_ms, pairs = resolve_jitter(history, host_stats)
+        self.assertEqual(pairs, 2)
+        self.assertAlmostEqual(jitter_ms, 7.5)
+
+        self.assertEqual(resolve_jitter(history, {"jitter_sum": 0.0, "jitter_pairs": 0, "jitter_window": 4}), (None, 0))
+
+
+class TestSummarySuffix(unittest.TestCase):
+    """Test cases for summary suffix builders."""
+
+    ENTRY = {
+        "sent": 10,
+        "received": 9,
+        "lost": 1,
+        "loss_rate": 10.0,
+        "avg_rtt_ms": 12.34,
+        "jitter_ms": None,
+        "stddev_ms": 0.5,
+        "latest_ttl": 64,
+        "streak_type": "success",
+        "streak_length": 4,
+    }
+
+    def test_mode_dispatch(self) -> None:
+        """Each summary mode should format its own fields, defaulting to rates."""
+        self.assertEqual(build_summary_suffix(self.ENTRY, "rtt"), ": avg rtt 12.3 ms jitter n/a stddev 0.5 ms")
+        self.assertEqual(build_summary_suffix(self.ENTRY, "ttl"), ": ttl 64")
+        self.assertEqual(build_summary_suffix(self.ENTRY, "streak"), ": streak S4")
+        self.assertEqual(build_summary_suffix(self.ENTRY, "rates"), ": 10/9/1 loss 10.0%")
+        self.assertEqual(build_summary_suffix(self.ENTRY, "unknown"), ": 10/9/1 loss 10.0%")
+
+    def test_all_suffix(self) -> None:
+        """The combined suffix should join every field."""
+        self.assertEqual(
+            build_summary_all_suffix(self.ENTRY),
+            ": 10/9/1 loss 10.0% | avg rtt 12.3 ms | jitter n/a | stddev 0.5 ms | ttl 64 | streak S4",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -168,6 +168,12 @@ class TestTimeAxis(unittest.TestCase):
         self.assertIn("10", timeline_part)
         self.assertLess(timeline_part.find("30"), timeline_part.find("10"))
 
+    def test_build_time_axis_is_reused_for_same_layout(self) -> None:
+        """Identical layouts should reuse the cached axis instead of rebuilding it."""
+        first = build_time_axis(timeline_width=120, label_width=12, interval_seconds=0.5)
+        self.assertIs(build_time_axis(timeline_width=120, label_width=12, interval_seconds=0.5), first)
+        self.assertNotEqual(build_time_axis(timeline_width=120, label_width=12, interval_seconds=2.0), first)
+
 
 if __name__ == "__main__":
     unittest.main()
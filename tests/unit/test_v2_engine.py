@@ -87,3 +87,63 @@ def test_resize_timeline_width_shrinks_and_rebuilds_pending_indices() -> None:
     assert list(timeline.symbols) == ["-", "-"]
     assert list(timeline.sequence_history) == [102, 103]
     assert timeline.pending_by_sequence == {102: 0, 103: 1}
+
+
+def test_streak_tracks_results_replacing_pending_slots() -> None:
+    state = MonitorState(host_ids=[0], timeline_width=8)
+    state.apply_event(PingEvent(host_id=0, sequence=1, status="success", sent_time=1.0, rtt_seconds=0.01))
+    state.apply_event(PingEvent(host_id=0, sequence=2, status="sent", sent_time=2.0))
+    state.apply_event(PingEvent(host_id=0, sequence=3, status="sent", sent_time=3.0))
+
+    assert (state.stats[0].streak_type, state.stats[0].streak_length) == (None, 0)
+
+    state.apply_event(PingEvent(host_id=0, sequence=2, status="slow", sent_time=2.1, rtt_seconds=0.2))
+    state.apply_event(PingEvent(host_id=0, sequence=3, status="success", sent_time=3.1, rtt_seconds=0.01))
+
+    assert (state.stats[0].streak_type, state.stats[0].streak_length) == ("success", 3)
+
+    state.apply_event(PingEvent(host_id=0, sequence=4, status="fail", sent_time=4.0))
+    state.apply_event(PingEvent(host_id=0, sequence=5, status="fail", sent_time=5.0))
+
+    assert (state.stats[0].streak_type, state.stats[0].streak_length) == ("fail", 2)
+
+
+def test_streak_is_bounded_by_timeline_width() -> None:
+    state = MonitorState(host_ids=[0], timeline_width=3)
+    for sequence in range(6):
+        state.apply_event(PingEvent(host_id=0, sequence=sequence, status="fail", sent_time=float(sequence)))
+
+    assert state.stats[0].streak_length == 3
+
+    state.resize_timeline_width(2)
+
+    assert (state.stats[0].streak_type, state.stats[0].streak_length) == ("fail", 2)
+
+
+def test_jitter_sums_follow_pending_replacement_and_eviction() -> None:
+    state = MonitorState(host_ids=[0], timeline_width=4)
+    state.apply_event(PingEvent(host_id=0, sequence=1, status="success", sent_time=1.0, rtt_seconds=0.010))
+    state.apply_event(PingEvent(host_id=0, sequence=2, status="sent", sent_time=2.0))
+    state.apply_event(PingEvent(host_id=0, sequence=3, status="success", sent_time=3.0, rtt_seconds=0.030))
+
+    assert state.stats[0].jitter_pairs == 1
+    assert abs(state.stats[0].jitter_sum - 0.020) < 1e-12
+
+    # A reply landing between two others splits their pair in two.
+    state.apply_event(PingEvent(host_id=0, sequence=2, status="success", sent_time=2.1, rtt_seconds=0.015))
+
+    assert state.stats[0].jitter_pairs == 2
+    assert abs(state.stats[0].jitter_sum - 0.020) < 1e-12
+
+    # Filling the window evicts the oldest reply and its pair.
+    state.apply_event(PingEvent(host_id=0, sequence=4, status="fail", sent_time=4.0))
+    state.apply_event(PingEvent(host_id=0, sequence=5, status="success", sent_time=5.0, rtt_seconds=0.040))
+
+    assert list(state.timelines[0].rtt_history) == [0.015, 0.030, None, 0.040]
+    assert state.stats[0].jitter_pairs == 2
+    assert abs(state.stats[0].jitter_sum - 0.025) < 1e-12
+
+    state.resize_timeline_width(2)
+
+    assert state.stats[0].jitter_pairs == 0
+    assert state.stats[0].jitter_sum == 0.0